@@ -22,7 +22,7 @@ CONTROLS:
     Right     = Open file/directory (/ key or Enter)
     Left      = Go up one directory (, key or Backspace)
     I         = Show storage info
-    R         = Refresh directory listing
+    R         = Refresh directory listing (re-check SD card in selector)
     ESC       = Exit to launcher (or return to selector from list)
 """
 
@@ -34,22 +34,46 @@ for path in ["/flash/lib", "/remote/lib"]:
         sys.path.insert(0, path)
 
 import os
+import time
 
 import machine
 from app_base import AppBase
-from keycode import KEY_NAV_DOWN, KEY_NAV_LEFT, KEY_NAV_RIGHT, KEY_NAV_UP, KeyCode
+from keycode import KEY_NAV_DOWN, KEY_NAV_LEFT, KEY_NAV_RIGHT, KEY_NAV_UP, KeyCode, key_map
 from M5 import Lcd, Widgets
 
 # Screen dimensions
 SCREEN_W = 240
 SCREEN_H = 135
 
+# Colors and key codes bound once here - each Lcd.COLOR.X / KeyCode.X in a
+# draw or key path would otherwise be two attribute lookups per use.
+# (micropython.const() only folds literal ints, so these are plain names.)
+BLACK = Lcd.COLOR.BLACK
+WHITE = Lcd.COLOR.WHITE
+RED = Lcd.COLOR.RED
+GREEN = Lcd.COLOR.GREEN
+BLUE = Lcd.COLOR.BLUE
+CYAN = Lcd.COLOR.CYAN
+MAGENTA = Lcd.COLOR.MAGENTA
+YELLOW = Lcd.COLOR.YELLOW
+DARKGREY = Lcd.COLOR.DARKGREY
+LIGHTGREY = Lcd.COLOR.LIGHTGREY
+
+KEY_ESC = KeyCode.KEYCODE_ESC
+KEY_ENTER = KeyCode.KEYCODE_ENTER
+KEY_BACKSPACE = KeyCode.KEYCODE_BACKSPACE
+KEY_UP = KeyCode.KEYCODE_UP
+KEY_DOWN = KeyCode.KEYCODE_DOWN
+KEY_LEFT = KeyCode.KEYCODE_LEFT
+KEY_RIGHT = KeyCode.KEYCODE_RIGHT
+
 # SD Card pins for Cardputer ADV
 SD_SCK = 40
 SD_MISO = 39
 SD_MOSI = 14
 SD_CS = 12
-SD_FREQ = 1000000  # 1 MHz (conservative, increase if stable)
+SD_FREQ = 1000000  # 1 MHz (conservative, used for the presence probe)
+SD_MOUNT_FREQS = (25000000, 10000000, SD_FREQ)  # Tried in order when mounting
 
 # Storage locations: (display_name, path, requires_mount)
 STORAGE_LOCATIONS = [
@@ -61,6 +85,30 @@ STORAGE_LOCATIONS = [
 # UI constants
 MAX_VISIBLE_ITEMS = 6  # Number of file entries visible at once
 ITEM_HEIGHT = 14  # Height of each file entry row
+MAX_NAME_LEN = 28  # Characters of a file name shown in the list
+# X position of a right-aligned size string, indexed by its length (6px font)
+SIZE_X = tuple(SCREEN_W - n * 6 - 4 for n in range(8))
+
+# File viewer limits (memory)
+MAX_FILE_BYTES = 4096  # Bytes read from the start of a file
+MAX_FILE_LINES = 100  # Lines kept for display
+VIEWER_COLS = 38  # Characters of a line that fit on screen
+
+# Directory listings kept in memory so revisiting a folder skips the rescan
+DIR_CACHE_SIZE = 8
+LOAD_YIELD_EVERY = 32  # Entries scanned between yields to the scheduler
+SD_PROBE_TTL_MS = 5000  # How long an SD card presence check is trusted
+INFO_CACHE_MS = 3000  # How long a statvfs result is reused by the info view
+
+# Small text files read ahead after a listing so opening one needs no SD read
+PREVIEW_MAX_BYTES = 2048  # Largest file that gets preloaded
+PREVIEW_CACHE_FILES = 4  # Files preloaded per directory
+PREVIEW_CACHE_BYTES = 8192  # Total bytes of preloaded content (heap budget)
+PREVIEW_EXTS = ("txt", "py", "cfg", "md", "json", "ini")
+
+# Formatted size strings by byte count, shared by every scan (bounded)
+_SIZE_CACHE = {}
+SIZE_CACHE_MAX = 64
 
 
 class FileBrowser(AppBase):
@@ -69,20 +117,39 @@ class FileBrowser(AppBase):
     def __init__(self):
         super().__init__()
         self.name = "File Browser"
-        self._sd = None  # SDCard object
+        self._sd = None  # SDCard object, kept across unmounts until on_exit
         self._sd_mounted = False  # Whether SD is mounted
+        self._sd_freq = 0  # SPI clock the card was mounted at (Hz)
         self._sd_available = None  # None = not checked, True/False = checked
+        self._sd_probe_time = 0  # ticks_ms of the last availability probe
         self._error_msg = ""  # Last error message
         self._current_path = ""  # Current directory path
+        self._path_display = ""  # Title bar text for current path
+        self._info_path = ""  # "Path: ..." line for the info view
         self._current_storage = None  # Index into STORAGE_LOCATIONS
+        self._storage_name = ""  # STORAGE_LOCATIONS fields for the current
+        self._storage_root = "/"  # storage, copied out once on selection
+        self._storage_is_sd = False  # so draws don't keep re-indexing
         self._storage_selected = 0  # Selected item in storage selector
-        self._entries = []  # List of (name, is_dir, size) tuples
+        self._entries = []  # List of (name, is_dir, size, size_str, display_name)
+        self._dir_cache = {}  # path -> entries list from a previous scan
+        self._load_task = None  # Running _scan_directory task, if any
+        self._info_cache = {}  # path -> (ticks_ms, storage info) from statvfs
+        self._preview_cache = {}  # path -> bytes of small files in this directory
+        self._loading = False  # True while the current directory is scanned
         self._selected = 0  # Currently selected entry index
         self._scroll_offset = 0  # Scroll offset for long lists
         self._view_mode = "selector"  # "selector", "list", "info", or "viewer"
-        self._file_content = []  # Lines of file being viewed
+        self._file_content = []  # Lines (bytes) of file being viewed
+        self._viewer_title = ""  # File name shown in the viewer title bar
         self._content_offset = 0  # Vertical scroll offset for file viewer
         self._content_h_offset = 0  # Horizontal scroll offset for long lines
+        self._max_line_len = 0  # Longest line in the file (for the > indicator)
+        self._row_canvas = None  # Canvas for list rows (created in on_launch)
+        self._text_size = 0  # Lcd text size last set (see _set_text_size)
+        # view mode -> {key code: handler}, built once so a keypress is a
+        # single dict lookup (see _kb_event_handler)
+        self._key_handlers = self._build_key_handlers()
 
     def on_launch(self):
         """Start in storage selector mode."""
@@ -92,13 +159,40 @@ class FileBrowser(AppBase):
         self._sd_available = None  # Will check when selector is drawn
         self._check_sd_available()
 
+        # Every view uses the same font, so set it once rather than per draw
+        Lcd.setFont(Widgets.FONTS.ASCII7)
+        Lcd.setTextSize(1)
+        self._text_size = 1
+
+        # Off-screen buffer for drawing one list row at a time
+        self._row_canvas = Lcd.newCanvas(SCREEN_W, ITEM_HEIGHT)
+        self._row_canvas.setFont(Widgets.FONTS.ASCII7)
+        self._row_canvas.setTextSize(1)
+
     def _check_sd_available(self):
-        """Check if SD card is available (try mount/unmount)."""
-        if self._sd_available is not None:
+        """Check if SD card is available (try the card handshake)."""
+        # Probing costs a full card init over SPI, so reuse a recent result
+        if (
+            self._sd_available is not None
+            and time.ticks_diff(time.ticks_ms(), self._sd_probe_time) < SD_PROBE_TTL_MS
+        ):
             return self._sd_available
 
+        if self._sd:
+            # A card that mounted earlier is still initialised, so reading
+            # one block tells us it's still there without a new handshake
+            try:
+                self._sd.readblocks(0, bytearray(512))
+                self._sd_available = True
+                self._sd_probe_time = time.ticks_ms()
+                return True
+            except OSError:
+                self._cleanup_sd()  # Removed or swapped - probe from scratch
+
         try:
-            # Try to initialize and mount SD card
+            # The card init handshake is enough to know a card is there -
+            # mounting it would just add FAT boot sector reads. _mount_sd()
+            # handles the real mount.
             sd = machine.SDCard(
                 slot=3,
                 sck=machine.Pin(SD_SCK),
@@ -107,21 +201,15 @@ class FileBrowser(AppBase):
                 cs=machine.Pin(SD_CS),
                 freq=SD_FREQ,
             )
-            # Try to mount temporarily
             try:
-                os.mount(sd, "/sd")
-                os.umount("/sd")
-            except OSError:
-                # May already be mounted or other issue
-                try:  # noqa: SIM105 - contextlib not available in MicroPython
-                    os.umount("/sd")
-                except OSError:
-                    pass
-            sd.deinit()
+                sd.info()  # Forces card init; raises OSError if no card
+            finally:
+                sd.deinit()
             self._sd_available = True
         except OSError:
             self._sd_available = False
 
+        self._sd_probe_time = time.ticks_ms()
         return self._sd_available
 
     def _mount_sd(self):
@@ -130,34 +218,71 @@ class FileBrowser(AppBase):
             return True
 
         self._error_msg = ""
+        last_error = None
+
+        # Reuse the SDCard from an earlier mount - remounting the VFS skips
+        # the SPI bus setup and card handshake
+        if self._sd:
+            try:
+                self._mount_only()
+                return True
+            except OSError:
+                self._cleanup_sd()  # Card swapped or reset - start over
 
+        # Try the fastest clock first; 1 MHz is the last resort that any
+        # card should accept
+        for freq in SD_MOUNT_FREQS:
+            try:
+                self._init_sdcard(freq)
+                self._mount_only()
+                self._sd_freq = freq
+                return True
+            except OSError as e:
+                last_error = e
+                self._cleanup_sd()
+
+        self._error_msg = f"Mount failed: {last_error}"
+        return False
+
+    def _init_sdcard(self, freq):
+        """Create the SDCard object (runs the card handshake at freq)."""
+        self._sd = machine.SDCard(
+            slot=3,
+            sck=machine.Pin(SD_SCK),
+            miso=machine.Pin(SD_MISO),
+            mosi=machine.Pin(SD_MOSI),
+            cs=machine.Pin(SD_CS),
+            freq=freq,
+        )
+
+    def _mount_only(self):
+        """Mount the existing SDCard object at /sd (VFS only, no card init)."""
         try:
-            self._sd = machine.SDCard(
-                slot=3,
-                sck=machine.Pin(SD_SCK),
-                miso=machine.Pin(SD_MISO),
-                mosi=machine.Pin(SD_MOSI),
-                cs=machine.Pin(SD_CS),
-                freq=SD_FREQ,
-            )
+            os.mount(self._sd, "/sd")
+        except OSError:
+            # Already mounted, unmount first
+            try:  # noqa: SIM105 - contextlib not available in MicroPython
+                os.umount("/sd")
+            except OSError:
+                pass
+            os.mount(self._sd, "/sd")
 
+        self._sd_mounted = True
+
+    def _remount_sd(self):
+        """Remount /sd for a refresh, keeping the SDCard object if it works."""
+        if self._sd:
+            self._sd_mounted = False
             try:
-                os.mount(self._sd, "/sd")
+                self._mount_only()
+                return True
             except OSError:
-                # Already mounted, unmount first
-                try:  # noqa: SIM105 - contextlib not available in MicroPython
-                    os.umount("/sd")
-                except OSError:
-                    pass
-                os.mount(self._sd, "/sd")
-
-            self._sd_mounted = True
-            return True
+                pass
 
-        except OSError as e:
-            self._error_msg = f"Mount failed: {e}"
-            self._cleanup_sd()
-            return False
+        # Card was swapped or reset - fall back to a full init
+        self._unmount_sd()
+        self._cleanup_sd()
+        return self._mount_sd()
 
     def _cleanup_sd(self):
         """Clean up SD card resources."""
@@ -169,15 +294,20 @@ class FileBrowser(AppBase):
             self._sd = None
 
     def _unmount_sd(self):
-        """Unmount and deinitialize SD card."""
+        """Unmount /sd, keeping the SDCard object for the next mount."""
         if self._sd_mounted:
             try:  # noqa: SIM105 - contextlib not available in MicroPython
                 os.umount("/sd")
             except OSError:
                 pass
             self._sd_mounted = False
+        self._forget_sd_caches()
 
-        self._cleanup_sd()
+    def _forget_sd_caches(self):
+        """Drop cached /sd listings and stats; they may belong to the old card."""
+        for path in [p for p in self._dir_cache if p == "/sd" or p.startswith("/sd/")]:
+            del self._dir_cache[path]
+        self._info_cache.pop("/sd", None)
 
     def _select_storage(self, index):
         """Select a storage location and enter it."""
@@ -187,46 +317,185 @@ class FileBrowser(AppBase):
             return False
 
         self._current_storage = index
-        self._current_path = path
+        self._storage_name = name
+        self._storage_root = path
+        self._storage_is_sd = requires_mount
+        self._set_current_path(path)
         self._load_directory()
         self._view_mode = "list"
         return True
 
     def _return_to_selector(self):
         """Return to storage selector, unmounting SD if needed."""
+        self._cancel_load()
         if self._sd_mounted:
             self._unmount_sd()
 
+        self._preview_cache = {}
+        self._info_cache = {}  # Storage stats are re-read on the next visit
         self._current_storage = None
         self._view_mode = "selector"
-        self._sd_available = None  # Re-check on next draw
-        self._check_sd_available()
+        self._check_sd_available()  # Re-probes only once the last result is stale
 
-    def _load_directory(self):
-        """Load entries from current directory."""
+    def _load_directory(self, force=False):
+        """
+        Load entries from current directory (cached, or scanned in background).
+
+        force=True skips the cache and rescans, replacing the cached listing.
+        """
         self._entries = []
         self._selected = 0
         self._scroll_offset = 0
         self._error_msg = ""
+        self._cancel_load()
+
+        cached = None if force else self._dir_cache.get(self._current_path)
+        if cached is not None:
+            self._entries = cached
+            if cached:
+                # No scan to piggyback on, but previews were dropped on
+                # leaving this directory - read them ahead again, as a load
+                # task so leaving it again cancels the read-ahead
+                self._load_task = asyncio.create_task(
+                    self._preload_previews(self._current_path, cached)
+                )
+            return
 
+        # Scan as a task so a large SD directory doesn't block key handling;
+        # the list shows "Loading..." until it finishes
+        self._loading = True
+        self._load_task = asyncio.create_task(self._scan_directory(self._current_path))
+
+    def _cancel_load(self):
+        """Stop any directory scan that is still running."""
+        if self._load_task:
+            self._load_task.cancel()
+            self._load_task = None
+        self._loading = False
+
+    def _iter_dir(self, path):
+        """Yield (name, is_dir, size) for each entry in a directory."""
         try:
-            items = os.listdir(self._current_path)
-            for name in sorted(items):
-                full_path = f"{self._current_path}/{name}"
-                try:
-                    stat = os.stat(full_path)
-                    # stat[0] is mode, 0x4000 = directory flag
-                    is_dir = (stat[0] & 0x4000) != 0
-                    size = stat[6]  # File size
-                    self._entries.append((name, is_dir, size))
-                except OSError:
-                    # Skip files we can't stat
-                    pass
+            ilistdir = os.ilistdir
+        except AttributeError:
+            ilistdir = None
+
+        if ilistdir is not None:
+            # ilistdir yields (name, type, inode, size) from a single directory
+            # walk, so we don't pay an os.stat() round trip per entry on SD
+            for entry in ilistdir(path):
+                size = entry[3] if len(entry) > 3 else 0
+                yield entry[0], (entry[1] & 0xF000) == 0x4000, size
+            return
+
+        # Ports without ilistdir: fall back to one stat per entry
+        for name in os.listdir(path):
+            try:
+                stat = os.stat(f"{path}/{name}")
+            except OSError:
+                continue  # Skip files we can't stat
+            # stat[0] is mode (0x4000 = directory), stat[6] is size
+            yield name, (stat[0] & 0xF000) == 0x4000, stat[6]
+
+    async def _scan_directory(self, path):
+        """Read a directory's entries, yielding to the scheduler as it goes."""
+        entries = []
+        try:
+            for name, is_dir, size in self._iter_dir(path):
+                # Build the display strings once here so drawing a row
+                # doesn't format sizes or truncate names on every redraw
+                display_name = name + "/" if is_dir else name
+                if len(display_name) > MAX_NAME_LEN:
+                    display_name = display_name[: MAX_NAME_LEN - 2] + ".."
+                size_str = "" if is_dir else self._format_size(size)
+
+                entries.append((name, is_dir, size, size_str, display_name))
+                if len(entries) % LOAD_YIELD_EVERY == 0:
+                    await asyncio.sleep_ms(0)
         except OSError as e:
             self._error_msg = f"Read error: {e}"
+            entries = None
+
+        self._loading = False
+
+        if entries is not None:
+            # Folders first, then case-insensitive by name. The key is one
+            # short string per entry ("0name" / "1name") - sort() computes it
+            # once per element, and comparing strings runs in C, which beats
+            # building and comparing a (bool, str) tuple for every entry
+            entries.sort(key=lambda e: ("0" if e[1] else "1") + e[0].lower())
+            self._entries = entries
+            if path not in self._dir_cache and len(self._dir_cache) >= DIR_CACHE_SIZE:
+                # MicroPython dicts don't keep insertion order, so this evicts
+                # an arbitrary entry rather than the oldest - fine for 8 slots
+                del self._dir_cache[next(iter(self._dir_cache))]
+            self._dir_cache[path] = self._entries
+
+        if self._view_mode == "list":
+            self.on_view()
+
+        if entries:
+            # The list is already on screen - use the idle time to read
+            # ahead the small text files the user is likely to open next
+            await self._preload_previews(path, entries)
+        self._load_task = None
+
+    async def _preload_previews(self, path, entries):
+        """Read small text files from a listing into _preview_cache."""
+        self._preview_cache = {}
+        budget = PREVIEW_CACHE_BYTES
+
+        # Entries are sorted, so this fills the cache from the top of the list
+        for name, is_dir, size, _size_str, _display in entries:
+            if len(self._preview_cache) >= PREVIEW_CACHE_FILES:
+                break
+            if is_dir or size > PREVIEW_MAX_BYTES or size > budget:
+                continue
+            if name[name.rfind(".") + 1 :].lower() not in PREVIEW_EXTS:
+                continue
+
+            full_path = f"{path}/{name}"
+            try:
+                with open(full_path, "rb") as f:
+                    data = f.read(PREVIEW_MAX_BYTES)
+            except OSError:
+                continue
+            self._preview_cache[full_path] = data
+            budget -= len(data)
+            await asyncio.sleep_ms(0)  # Let key presses through between files
+
+    def _set_current_path(self, path):
+        """Change directory and rebuild the path strings the views display."""
+        self._current_path = path
+        self._preview_cache = {}  # Previews belong to the directory we left
+
+        # Title bar: "Storage:/rel/path"
+        rel_path = path[len(self._storage_root) :] or "/"
+        display = f"{self._storage_name}:{rel_path}"
+        if len(display) > 38:
+            display = display[:35] + "..."
+        self._path_display = display
+
+        # Info view: full path, keeping the tail if it's too long
+        if len(path) > 30:
+            path = "..." + path[-27:]
+        self._info_path = f"Path: {path}"
 
     def _get_storage_info(self, path):
         """Get storage info for any mount point using statvfs."""
+        # statvfs counts free clusters by walking the FAT, which is slow on
+        # SD - reuse a recent result instead of re-running it on every redraw
+        now = time.ticks_ms()
+        cached = self._info_cache.get(path)
+        if cached is not None and time.ticks_diff(now, cached[0]) < INFO_CACHE_MS:
+            return cached[1]
+
+        info = self._read_storage_info(path)
+        self._info_cache[path] = (now, info)
+        return info
+
+    def _read_storage_info(self, path):
+        """Run statvfs on a mount point and convert the result to MB."""
         try:
             stat = os.statvfs(path)
             # statvfs returns tuple:
@@ -250,12 +519,21 @@ class FileBrowser(AppBase):
 
     def _format_size(self, size):
         """Format file size for display."""
+        # Same-size files (and rescans of a folder) reuse one string object
+        s = _SIZE_CACHE.get(size)
+        if s is not None:
+            return s
+
         if size < 1024:
-            return f"{size}B"
+            s = f"{size}B"
         elif size < 1024 * 1024:
-            return f"{size // 1024}K"
+            s = f"{size // 1024}K"
         else:
-            return f"{size // (1024 * 1024)}M"
+            s = f"{size // (1024 * 1024)}M"
+
+        if len(_SIZE_CACHE) < SIZE_CACHE_MAX:
+            _SIZE_CACHE[size] = s
+        return s
 
     def on_view(self):
         """Draw the appropriate view."""
@@ -268,198 +546,177 @@ class FileBrowser(AppBase):
         elif self._view_mode == "viewer":
             self._draw_file_viewer()
 
+    def _set_text_size(self, size):
+        """Change the Lcd text size, skipping the driver call if it's unchanged."""
+        if size != self._text_size:
+            Lcd.setTextSize(size)
+            self._text_size = size
+
     def _draw_selector_view(self):
         """Draw storage location selector."""
-        Lcd.fillScreen(Lcd.COLOR.BLACK)
-        Lcd.setFont(Widgets.FONTS.ASCII7)
+        Lcd.fillScreen(BLACK)
 
         # Title
-        Lcd.setTextSize(2)
-        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
-        Lcd.setCursor(10, 5)
-        Lcd.print("File Browser")
+        self._set_text_size(2)
+        Lcd.setTextColor(WHITE, BLACK)
+        Lcd.drawString("File Browser", 10, 5)
 
-        Lcd.setTextSize(1)
-        Lcd.setTextColor(Lcd.COLOR.CYAN, Lcd.COLOR.BLACK)
-        Lcd.setCursor(10, 28)
-        Lcd.print("Select storage location:")
+        self._set_text_size(1)
+        Lcd.setTextColor(CYAN, BLACK)
+        Lcd.drawString("Select storage location:", 10, 28)
 
         # Storage options
-        y = 45
-        for i, (name, path, requires_mount) in enumerate(STORAGE_LOCATIONS):
-            is_selected = i == self._storage_selected
-
-            # Check availability for SD card
-            available = True
-            status = ""
-            if requires_mount:
-                available = self._sd_available if self._sd_available is not None else True
-                if not available:
-                    status = " (no card)"
-
-            # Background for selected
-            if is_selected:
-                Lcd.fillRect(0, y, SCREEN_W, ITEM_HEIGHT + 4, Lcd.COLOR.DARKGREY)
-
-            bg = Lcd.COLOR.DARKGREY if is_selected else Lcd.COLOR.BLACK
-
-            # Storage name
-            if available:
-                color = Lcd.COLOR.WHITE if is_selected else Lcd.COLOR.LIGHTGREY
-            else:
-                color = Lcd.COLOR.RED
+        for i in range(len(STORAGE_LOCATIONS)):
+            self._draw_storage_row(i)
+
+        # Footer
+        Lcd.setTextColor(WHITE, BLACK)
+        Lcd.drawString("Up/Dn=Nav Rt=Open R=Rescan ESC=Exit", 0, SCREEN_H - 12)
 
-            Lcd.setTextColor(color, bg)
-            Lcd.setCursor(10, y + 2)
-            Lcd.print(f"{name}{status}")
+    def _draw_storage_row(self, i):
+        """Draw one storage option (used to repaint only changed rows)."""
+        name, path, requires_mount = STORAGE_LOCATIONS[i]
+        is_selected = i == self._storage_selected
+        y = 45 + i * (ITEM_HEIGHT + 6)
 
-            # Path hint
-            Lcd.setTextColor(Lcd.COLOR.YELLOW if is_selected else Lcd.COLOR.DARKGREY, bg)
-            Lcd.setCursor(120, y + 2)
-            Lcd.print(path)
+        # Check availability for SD card
+        available = True
+        status = ""
+        if requires_mount:
+            available = self._sd_available if self._sd_available is not None else True
+            if not available:
+                status = " (no card)"
 
-            y += ITEM_HEIGHT + 6
+        # Background (also clears the previous highlight when redrawn)
+        bg = DARKGREY if is_selected else BLACK
+        Lcd.fillRect(0, y, SCREEN_W, ITEM_HEIGHT + 4, bg)
 
-        # Footer
-        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
-        Lcd.setCursor(0, SCREEN_H - 12)
-        Lcd.print("Up/Dn=Nav  Rt=Open  ESC=Exit")
+        # Storage name
+        color = (WHITE if is_selected else LIGHTGREY) if available else RED
+
+        Lcd.setTextColor(color, bg)
+        Lcd.drawString(f"{name}{status}", 10, y + 2)
+
+        # Path hint
+        Lcd.setTextColor(YELLOW if is_selected else DARKGREY, bg)
+        Lcd.drawString(path, 120, y + 2)
 
     def _draw_list_view(self):
         """Draw file browser list view."""
-        Lcd.fillScreen(Lcd.COLOR.BLACK)
-        Lcd.setFont(Widgets.FONTS.ASCII7)
 
         # Title bar with storage name and path
-        Lcd.setTextSize(1)
-        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLUE)
-        Lcd.fillRect(0, 0, SCREEN_W, 12, Lcd.COLOR.BLUE)
-        Lcd.setCursor(2, 2)
+        self._set_text_size(1)
+        Lcd.setTextColor(WHITE, BLUE)
+        Lcd.fillRect(0, 0, SCREEN_W, 12, BLUE)
 
         # Show storage name and relative path
         if self._current_storage is not None:
-            storage_name = STORAGE_LOCATIONS[self._current_storage][0]
-            storage_root = STORAGE_LOCATIONS[self._current_storage][1]
-            rel_path = self._current_path[len(storage_root) :] or "/"
-            display = f"{storage_name}:{rel_path}"
-            if len(display) > 38:
-                display = display[:35] + "..."
-            Lcd.print(display)
+            Lcd.drawString(self._path_display, 2, 2)
+
+        # Rows paint their own background (see _draw_row), so instead of a
+        # full-screen fill only clear the parts of the screen they don't cover
+        show_rows = not self._error_msg and not self._loading and self._entries
+        if show_rows:
+            visible_end = min(self._scroll_offset + MAX_VISIBLE_ITEMS, len(self._entries))
+            body_y = 14 + (visible_end - self._scroll_offset) * ITEM_HEIGHT
+            Lcd.fillRect(0, 12, SCREEN_W, 2, BLACK)
+        else:
+            body_y = 12
+        Lcd.fillRect(0, body_y, SCREEN_W, SCREEN_H - body_y, BLACK)
 
         # Error state
         if self._error_msg:
-            Lcd.setTextSize(1)
-            Lcd.setTextColor(Lcd.COLOR.RED, Lcd.COLOR.BLACK)
-            Lcd.setCursor(10, 40)
+            self._set_text_size(1)
+            Lcd.setTextColor(RED, BLACK)
             if len(self._error_msg) > 35:
-                Lcd.print(self._error_msg[:35])
-                Lcd.setCursor(10, 52)
-                Lcd.print(self._error_msg[35:70])
+                Lcd.drawString(self._error_msg[:35], 10, 40)
+                Lcd.drawString(self._error_msg[35:70], 10, 52)
             else:
-                Lcd.print(self._error_msg)
+                Lcd.drawString(self._error_msg, 10, 40)
 
-            Lcd.setTextColor(Lcd.COLOR.CYAN, Lcd.COLOR.BLACK)
-            Lcd.setCursor(10, 80)
-            Lcd.print("BS=Back  R=Retry  ESC=Exit")
+            Lcd.setTextColor(CYAN, BLACK)
+            Lcd.drawString("BS=Back  R=Retry  ESC=Exit", 10, 80)
             return
 
         # File list
-        y = 14
-        visible_end = min(self._scroll_offset + MAX_VISIBLE_ITEMS, len(self._entries))
-
-        if len(self._entries) == 0:
-            Lcd.setTextColor(Lcd.COLOR.YELLOW, Lcd.COLOR.BLACK)
-            Lcd.setCursor(10, 40)
-            Lcd.print("(empty directory)")
+        if self._loading:
+            Lcd.setTextColor(YELLOW, BLACK)
+            Lcd.drawString("Loading...", 10, 40)
+        elif len(self._entries) == 0:
+            Lcd.setTextColor(YELLOW, BLACK)
+            Lcd.drawString("(empty directory)", 10, 40)
         else:
             for i in range(self._scroll_offset, visible_end):
-                name, is_dir, size = self._entries[i]
-                is_selected = i == self._selected
+                self._draw_row(i)
 
-                # Background for selected item
-                if is_selected:
-                    Lcd.fillRect(0, y, SCREEN_W, ITEM_HEIGHT, Lcd.COLOR.DARKGREY)
+        # Footer with controls
+        Lcd.setTextColor(WHITE, BLACK)
+        Lcd.drawString("Up/Dn=Nav Rt=Open Lt=Back", 0, SCREEN_H - 22)
+        Lcd.drawString("I=Info R=Refresh ESC=Exit", 0, SCREEN_H - 10)
+
+    def _draw_row(self, i):
+        """Draw a single file list row (used to repaint only changed rows)."""
+        name, is_dir, size, size_str, display_name = self._entries[i]
+        is_selected = i == self._selected
+        y = 14 + (i - self._scroll_offset) * ITEM_HEIGHT
+
+        # Compose the row off-screen, then push it in one transfer instead
+        # of a separate LCD transaction per fill/color/cursor/print call
+        canvas = self._row_canvas
+        bg = DARKGREY if is_selected else BLACK
+        canvas.fillScreen(bg)
+
+        # Directories in blue/cyan, files in white/grey
+        if is_dir:
+            canvas.setTextColor(CYAN if is_selected else BLUE, bg)
+        else:
+            canvas.setTextColor(WHITE if is_selected else LIGHTGREY, bg)
 
-                bg = Lcd.COLOR.DARKGREY if is_selected else Lcd.COLOR.BLACK
+        canvas.drawString(display_name, 4, 2)
 
-                # Display name with "/" suffix for directories
-                display_name = name + "/" if is_dir else name
-                max_name_len = 28
+        # Size (right-aligned, files only)
+        if not is_dir:
+            canvas.setTextColor(YELLOW, bg)
+            canvas.drawString(size_str, SIZE_X[len(size_str)], 2)
 
-                # Truncate if needed
-                if len(display_name) > max_name_len:
-                    display_name = display_name[: max_name_len - 2] + ".."
+        # Scroll indicators sit on the first/last visible rows
+        if i == self._scroll_offset and self._scroll_offset > 0:
+            canvas.setTextColor(MAGENTA, bg)
+            canvas.drawString("^", SCREEN_W - 12, 0)
+        if i == self._scroll_offset + MAX_VISIBLE_ITEMS - 1 and i < len(self._entries) - 1:
+            canvas.setTextColor(MAGENTA, bg)
+            canvas.drawString("v", SCREEN_W - 12, 2)
 
-                # Directories in blue/cyan, files in white/grey
-                if is_dir:
-                    Lcd.setTextColor(Lcd.COLOR.CYAN if is_selected else Lcd.COLOR.BLUE, bg)
-                else:
-                    Lcd.setTextColor(Lcd.COLOR.WHITE if is_selected else Lcd.COLOR.LIGHTGREY, bg)
-
-                Lcd.setCursor(4, y + 2)
-                Lcd.print(display_name)
-
-                # Size (right-aligned, files only)
-                if not is_dir:
-                    size_str = self._format_size(size)
-                    Lcd.setTextColor(Lcd.COLOR.YELLOW, bg)
-                    Lcd.setCursor(SCREEN_W - len(size_str) * 6 - 4, y + 2)
-                    Lcd.print(size_str)
-
-                y += ITEM_HEIGHT
-
-        # Scroll indicators
-        if self._scroll_offset > 0:
-            Lcd.setTextColor(Lcd.COLOR.MAGENTA, Lcd.COLOR.BLACK)
-            Lcd.setCursor(SCREEN_W - 12, 14)
-            Lcd.print("^")
-        if visible_end < len(self._entries):
-            Lcd.setTextColor(Lcd.COLOR.MAGENTA, Lcd.COLOR.BLACK)
-            Lcd.setCursor(SCREEN_W - 12, y - ITEM_HEIGHT + 2)
-            Lcd.print("v")
-
-        # Footer with controls
-        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
-        Lcd.setCursor(0, SCREEN_H - 22)
-        Lcd.print("Up/Dn=Nav Rt=Open Lt=Back")
-        Lcd.setCursor(0, SCREEN_H - 10)
-        Lcd.print("I=Info R=Refresh ESC=Exit")
+        canvas.push(0, y)
 
     def _draw_info_view(self):
         """Draw storage info view."""
-        Lcd.fillScreen(Lcd.COLOR.BLACK)
-        Lcd.setFont(Widgets.FONTS.ASCII7)
+        Lcd.fillScreen(BLACK)
 
         # Title
-        Lcd.setTextSize(2)
-        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
-        Lcd.setCursor(10, 5)
+        self._set_text_size(2)
+        Lcd.setTextColor(WHITE, BLACK)
 
         if self._current_storage is not None:
-            storage_name = STORAGE_LOCATIONS[self._current_storage][0]
-            Lcd.print(f"{storage_name} Info")
+            Lcd.drawString(f"{self._storage_name} Info", 10, 5)
         else:
-            Lcd.print("Storage Info")
+            Lcd.drawString("Storage Info", 10, 5)
 
-        Lcd.setTextSize(1)
+        self._set_text_size(1)
 
         # Get storage info for current storage root
-        storage_root = STORAGE_LOCATIONS[self._current_storage][1] if self._current_storage else "/"
-        info = self._get_storage_info(storage_root)
+        info = self._get_storage_info(self._storage_root)
 
         if info:
             # Storage stats
-            Lcd.setTextColor(Lcd.COLOR.GREEN, Lcd.COLOR.BLACK)
-            Lcd.setCursor(10, 30)
-            Lcd.print(f"Total: {info['total']:.1f} MB")
+            Lcd.setTextColor(GREEN, BLACK)
+            Lcd.drawString(f"Total: {info['total']:.1f} MB", 10, 30)
 
-            Lcd.setTextColor(Lcd.COLOR.YELLOW, Lcd.COLOR.BLACK)
-            Lcd.setCursor(10, 45)
-            Lcd.print(f"Used:  {info['used']:.1f} MB ({info['percent']:.1f}%)")
+            Lcd.setTextColor(YELLOW, BLACK)
+            Lcd.drawString(f"Used:  {info['used']:.1f} MB ({info['percent']:.1f}%)", 10, 45)
 
-            Lcd.setTextColor(Lcd.COLOR.CYAN, Lcd.COLOR.BLACK)
-            Lcd.setCursor(10, 60)
-            Lcd.print(f"Free:  {info['free']:.1f} MB")
+            Lcd.setTextColor(CYAN, BLACK)
+            Lcd.drawString(f"Free:  {info['free']:.1f} MB", 10, 60)
 
             # Usage bar
             bar_x = 10
@@ -468,134 +725,186 @@ class FileBrowser(AppBase):
             bar_h = 12
 
             # Background
-            Lcd.drawRect(bar_x, bar_y, bar_w, bar_h, Lcd.COLOR.WHITE)
+            Lcd.drawRect(bar_x, bar_y, bar_w, bar_h, WHITE)
 
             # Filled portion
             filled_w = int(bar_w * info["percent"] / 100)
             if filled_w > 0:
                 # Color based on usage
                 if info["percent"] > 90:
-                    fill_color = Lcd.COLOR.RED
+                    fill_color = RED
                 elif info["percent"] > 70:
-                    fill_color = Lcd.COLOR.YELLOW
+                    fill_color = YELLOW
                 else:
-                    fill_color = Lcd.COLOR.GREEN
+                    fill_color = GREEN
                 Lcd.fillRect(bar_x + 1, bar_y + 1, filled_w - 2, bar_h - 2, fill_color)
 
             # Current path
-            Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
-            Lcd.setCursor(10, 98)
-            path_display = self._current_path
-            if len(path_display) > 30:
-                path_display = "..." + path_display[-27:]
-            Lcd.print(f"Path: {path_display}")
+            Lcd.setTextColor(WHITE, BLACK)
+            Lcd.drawString(self._info_path, 10, 98)
+
+            # SPI clock negotiated when the SD card was mounted
+            if self._sd_mounted and self._storage_is_sd:
+                Lcd.drawString(f"SPI:  {self._sd_freq // 1000000} MHz", 10, 110)
         else:
-            Lcd.setTextColor(Lcd.COLOR.RED, Lcd.COLOR.BLACK)
-            Lcd.setCursor(10, 50)
-            Lcd.print("Info not available")
+            Lcd.setTextColor(RED, BLACK)
+            Lcd.drawString("Info not available", 10, 50)
 
         # Footer
-        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
-        Lcd.setCursor(0, SCREEN_H - 12)
-        Lcd.print("Any key=Back to list  ESC=Exit")
+        Lcd.setTextColor(WHITE, BLACK)
+        Lcd.drawString("Any key=Back to list  ESC=Exit", 0, SCREEN_H - 12)
 
     def _draw_file_viewer(self):
         """Draw text file viewer."""
-        Lcd.fillScreen(Lcd.COLOR.BLACK)
-        Lcd.setFont(Widgets.FONTS.ASCII7)
+        Lcd.fillScreen(BLACK)
 
         # Title bar
-        Lcd.setTextSize(1)
-        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLUE)
-        Lcd.fillRect(0, 0, SCREEN_W, 12, Lcd.COLOR.BLUE)
-        Lcd.setCursor(2, 2)
-
-        # Show filename from selected entry
-        if 0 <= self._selected < len(self._entries):
-            name = self._entries[self._selected][0]
-            if len(name) > 35:
-                name = name[:32] + "..."
-            Lcd.print(name)
-
-        # File content
-        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
+        self._set_text_size(1)
+        Lcd.setTextColor(WHITE, BLUE)
+        Lcd.fillRect(0, 0, SCREEN_W, 12, BLUE)
+
+        # Show filename of the open file
+        Lcd.drawString(self._viewer_title, 2, 2)
+
+        self._draw_viewer_content()
+
+        # Footer
+        Lcd.setTextColor(WHITE, BLACK)
+        Lcd.drawString("Arrows=Scroll  BS/ESC=Back", 0, SCREEN_H - 10)
+
+    def _draw_viewer_content(self):
+        """Draw the viewer's text lines, scroll indicators and line count."""
+        # Clear just the text area and line count - title and footer stay
+        Lcd.fillRect(0, 12, SCREEN_W, SCREEN_H - 24, BLACK)
+
+        Lcd.setTextColor(WHITE, BLACK)
         max_lines = 8
-        max_chars = 38  # Characters that fit on screen
+        max_chars = VIEWER_COLS
         y = 14
 
         if not self._file_content:
-            Lcd.setCursor(10, 40)
-            Lcd.print("(empty file)")
+            Lcd.drawString("(empty file)", 10, 40)
         else:
             visible_end = min(self._content_offset + max_lines, len(self._file_content))
-            max_line_len = 0  # Track longest line for scroll indicator
             for i in range(self._content_offset, visible_end):
                 line = self._file_content[i]
-                max_line_len = max(max_line_len, len(line))
-                # Apply horizontal offset and limit to screen width
+                # Decode just this visible line, then apply horizontal offset
+                # and limit to screen width
+                line = self._decode_line(line)
                 line = line[self._content_h_offset : self._content_h_offset + max_chars]
-                Lcd.setCursor(2, y)
-                Lcd.print(line)
+                Lcd.drawString(line, 2, y)
                 y += 12
 
             # Vertical scroll indicators
             if self._content_offset > 0:
-                Lcd.setTextColor(Lcd.COLOR.MAGENTA, Lcd.COLOR.BLACK)
-                Lcd.setCursor(SCREEN_W - 12, 14)
-                Lcd.print("^")
+                Lcd.setTextColor(MAGENTA, BLACK)
+                Lcd.drawString("^", SCREEN_W - 12, 14)
             if visible_end < len(self._file_content):
-                Lcd.setTextColor(Lcd.COLOR.MAGENTA, Lcd.COLOR.BLACK)
-                Lcd.setCursor(SCREEN_W - 12, y - 12)
-                Lcd.print("v")
+                Lcd.setTextColor(MAGENTA, BLACK)
+                Lcd.drawString("v", SCREEN_W - 12, y - 12)
 
             # Horizontal scroll indicators
             if self._content_h_offset > 0:
-                Lcd.setTextColor(Lcd.COLOR.MAGENTA, Lcd.COLOR.BLACK)
-                Lcd.setCursor(0, 60)
-                Lcd.print("<")
-            if self._content_h_offset + max_chars < max_line_len:
-                Lcd.setTextColor(Lcd.COLOR.MAGENTA, Lcd.COLOR.BLACK)
-                Lcd.setCursor(SCREEN_W - 8, 60)
-                Lcd.print(">")
+                Lcd.setTextColor(MAGENTA, BLACK)
+                Lcd.drawString("<", 0, 60)
+            if self._content_h_offset + max_chars < self._max_line_len:
+                Lcd.setTextColor(MAGENTA, BLACK)
+                Lcd.drawString(">", SCREEN_W - 8, 60)
 
         # Line count
-        Lcd.setTextColor(Lcd.COLOR.CYAN, Lcd.COLOR.BLACK)
-        Lcd.setCursor(SCREEN_W - 60, SCREEN_H - 22)
-        Lcd.print(f"L{self._content_offset + 1}/{len(self._file_content)}")
-
-        # Footer
-        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
-        Lcd.setCursor(0, SCREEN_H - 10)
-        Lcd.print("Arrows=Scroll  BS/ESC=Back")
+        Lcd.setTextColor(CYAN, BLACK)
+        Lcd.drawString(
+            f"L{self._content_offset + 1}/{len(self._file_content)}", SCREEN_W - 60, SCREEN_H - 22
+        )
 
     def _open_file(self, path):
-        """Open and read a text file."""
+        """Open and read the start of a text file."""
         self._file_content = []
         self._content_offset = 0
         self._content_h_offset = 0
 
+        # Title bar text, truncated once here rather than on every scroll
+        name = path[path.rfind("/") + 1 :]
+        if len(name) > 35:
+            name = name[:32] + "..."
+        self._viewer_title = name
+
         try:
-            with open(path) as f:
-                # Read up to 100 lines (memory limit)
-                for _ in range(100):
-                    line = f.readline()
-                    if not line:
-                        break
-                    # Strip trailing newline
-                    self._file_content.append(line.rstrip("\n\r"))
+            # Small text files were usually read ahead with the listing
+            data = self._preview_cache.get(path)
+            if data is None:
+                # One bulk read instead of a readline() loop - on SD each
+                # readline can turn into its own cluster read
+                with self._open_buffered(path) as f:
+                    data = f.read(MAX_FILE_BYTES)
+
+            truncated = len(data) == MAX_FILE_BYTES
+            if truncated:
+                # Cut at the last newline so a multi-byte char isn't split
+                end = data.rfind(b"\n")
+                if end > 0:
+                    data = data[:end]
+
+            # Text files don't contain NUL bytes, so treat those as binary
+            if b"\x00" in data:
+                self._file_content = [b"(binary file - cannot display)"]
+            else:
+                self._file_content = self._split_lines(data, truncated)
         except OSError as e:
-            self._file_content = [f"Error: {e}"]
-        except Exception:  # noqa: BLE001 - catch decode errors for binary files
-            self._file_content = ["(binary file - cannot display)"]
+            self._file_content = [f"Error: {e}".encode()]
+
+        # Measured once per file rather than over the visible lines per redraw,
+        # in decoded chars since that's what the viewer slices. A line's char
+        # count never exceeds its byte count, so only lines longer (in bytes)
+        # than the longest so far need decoding
+        longest = 0
+        for line in self._file_content:
+            if len(line) > longest:
+                n = len(self._decode_line(line))
+                if n > longest:
+                    longest = n
+        self._max_line_len = longest
 
         self._view_mode = "viewer"
 
+    def _open_buffered(self, path):
+        """Open a file for binary reading with a read buffer as big as a view."""
+        try:
+            return open(path, "rb", MAX_FILE_BYTES)
+        except TypeError:
+            # Build doesn't accept the buffering argument
+            return open(path, "rb")
+
+    def _split_lines(self, data, truncated):
+        """Split file bytes into display lines, marking truncated content."""
+        if data.endswith(b"\n"):
+            data = data[:-1]
+
+        # Lines stay as bytes - only the ones on screen get decoded when
+        # drawn, instead of allocating a str for every line up front
+        lines = data.split(b"\n", MAX_FILE_LINES) if data else []
+        if len(lines) > MAX_FILE_LINES:
+            lines.pop()  # Unsplit remainder after the last kept line
+            truncated = True
+
+        lines = [line[:-1] if line.endswith(b"\r") else line for line in lines]
+        if truncated:
+            lines.append(b"...(truncated)")
+        return lines
+
+    def _decode_line(self, line):
+        """Decode one line of file content for display."""
+        try:
+            return line.decode("utf-8")
+        except UnicodeError:
+            return "?" * len(line)  # Not valid UTF-8 - show placeholders
+
     def _navigate_up(self):
         """Go up one directory level or return to selector."""
         if self._current_storage is None:
             return
 
-        storage_root = STORAGE_LOCATIONS[self._current_storage][1]
+        storage_root = self._storage_root
 
         # At storage root? Return to selector
         if self._current_path == storage_root:
@@ -606,9 +915,9 @@ class FileBrowser(AppBase):
         # Remove last path component
         last_slash = self._current_path.rfind("/")
         if last_slash > 0:
-            self._current_path = self._current_path[:last_slash]
+            self._set_current_path(self._current_path[:last_slash])
         else:
-            self._current_path = storage_root
+            self._set_current_path(storage_root)
 
         self._load_directory()
         self.on_view()
@@ -618,171 +927,187 @@ class FileBrowser(AppBase):
         if not self._entries:
             return
 
-        name, is_dir, size = self._entries[self._selected]
+        name, is_dir, _size, _size_str, _display = self._entries[self._selected]
         full_path = f"{self._current_path}/{name}"
 
         if is_dir:
-            self._current_path = full_path
+            self._set_current_path(full_path)
             self._load_directory()
             self.on_view()
         else:
             self._open_file(full_path)
             self.on_view()
 
-    async def _kb_event_handler(self, event, fw):
-        """Handle keyboard events."""
-        key = event.key
-
-        # ESC handling
-        if key == KeyCode.KEYCODE_ESC:
-            if self._view_mode == "viewer":
-                self._view_mode = "list"
-                self.on_view()
-                event.status = True
-                return
-            if self._view_mode == "info":
-                self._view_mode = "list"
-                self.on_view()
-                event.status = True
-                return
-            # In list mode, return to selector first
-            if self._view_mode == "list":
-                self._return_to_selector()
-                self.on_view()
-                event.status = True
-                return
-            # In selector mode, let framework handle ESC to exit app
-            return
+    # --- Key handlers (looked up through self._key_handlers) ---
 
-        # Storage selector controls
-        if self._view_mode == "selector":
-            if key in (KeyCode.KEYCODE_UP, KEY_NAV_UP):
-                if self._storage_selected > 0:
-                    self._storage_selected -= 1
-                    self.on_view()
-                event.status = True
-                return
-
-            if key in (KeyCode.KEYCODE_DOWN, KEY_NAV_DOWN):
-                if self._storage_selected < len(STORAGE_LOCATIONS) - 1:
-                    self._storage_selected += 1
-                    self.on_view()
-                event.status = True
-                return
-
-            if key in (KeyCode.KEYCODE_ENTER, KEY_NAV_RIGHT):
-                # Check if SD card is available
-                name, path, requires_mount = STORAGE_LOCATIONS[self._storage_selected]
-                if requires_mount and not self._sd_available:
-                    # Can't select unavailable storage
-                    event.status = True
-                    return
-
-                if self._select_storage(self._storage_selected):
-                    self.on_view()
-                event.status = True
-                return
-
-            event.status = True
-            return
+    def _back_to_list(self):
+        """Leave the viewer or info screen."""
+        self._view_mode = "list"
+        self.on_view()
 
-        # Backspace - go up or exit viewer (comma handled separately for horizontal scroll)
-        if key == KeyCode.KEYCODE_BACKSPACE:
-            if self._view_mode in ("viewer", "info"):
-                self._view_mode = "list"
-                self.on_view()
-            elif self._view_mode == "list":
-                self._navigate_up()
-            event.status = True
-            return
+    def _leave_list(self):
+        """ESC in the list - return to the storage selector."""
+        self._return_to_selector()
+        self.on_view()
 
-        # Comma (left) in list mode - go up directory
-        if key == KEY_NAV_LEFT and self._view_mode == "list":
-            self._navigate_up()
-            event.status = True
+    def _selector_up(self):
+        if self._storage_selected > 0:
+            self._storage_selected -= 1
+            self._draw_storage_row(self._storage_selected + 1)
+            self._draw_storage_row(self._storage_selected)
+
+    def _selector_down(self):
+        if self._storage_selected < len(STORAGE_LOCATIONS) - 1:
+            self._storage_selected += 1
+            self._draw_storage_row(self._storage_selected - 1)
+            self._draw_storage_row(self._storage_selected)
+
+    def _selector_open(self):
+        # Can't select SD storage when no card is present
+        if STORAGE_LOCATIONS[self._storage_selected][2] and not self._sd_available:
             return
-
-        # Info view - any key returns to list
-        if self._view_mode == "info":
-            self._view_mode = "list"
+        if self._select_storage(self._storage_selected):
             self.on_view()
-            event.status = True
-            return
 
-        # File viewer controls
-        if self._view_mode == "viewer":
-            if key in (KeyCode.KEYCODE_UP, KEY_NAV_UP) and self._content_offset > 0:
-                self._content_offset -= 1
-                self.on_view()
-            elif (
-                key in (KeyCode.KEYCODE_DOWN, KEY_NAV_DOWN)
-                and self._content_offset < len(self._file_content) - 1
-            ):
-                self._content_offset += 1
-                self.on_view()
-            elif key in (KeyCode.KEYCODE_RIGHT, KEY_NAV_RIGHT):
-                # Scroll right (show more of long lines)
-                self._content_h_offset += 10
+    def _selector_rescan(self):
+        # R = Re-check SD card now (e.g. after inserting one)
+        self._sd_available = None
+        self._check_sd_available()
+        self.on_view()
+
+    def _list_up(self):
+        if self._selected > 0:
+            self._selected -= 1
+            # Adjust scroll if needed (shifts every row, so full redraw)
+            if self._selected < self._scroll_offset:
+                self._scroll_offset = self._selected
                 self.on_view()
-            elif key in (KeyCode.KEYCODE_LEFT, KEY_NAV_LEFT) and self._content_h_offset > 0:
-                # Scroll left
-                self._content_h_offset = max(0, self._content_h_offset - 10)
+            else:
+                # Only the old and new selection rows changed
+                self._draw_row(self._selected + 1)
+                self._draw_row(self._selected)
+
+    def _list_down(self):
+        if self._selected < len(self._entries) - 1:
+            self._selected += 1
+            # Adjust scroll if needed (shifts every row, so full redraw)
+            if self._selected >= self._scroll_offset + MAX_VISIBLE_ITEMS:
+                self._scroll_offset = self._selected - MAX_VISIBLE_ITEMS + 1
                 self.on_view()
-            event.status = True
-            return
+            else:
+                # Only the old and new selection rows changed
+                self._draw_row(self._selected - 1)
+                self._draw_row(self._selected)
 
-        # List view controls
-        if self._view_mode == "list":
-            if key in (KeyCode.KEYCODE_UP, KEY_NAV_UP):
-                if self._selected > 0:
-                    self._selected -= 1
-                    # Adjust scroll if needed
-                    if self._selected < self._scroll_offset:
-                        self._scroll_offset = self._selected
-                    self.on_view()
-                event.status = True
-                return
-
-            if key in (KeyCode.KEYCODE_DOWN, KEY_NAV_DOWN):
-                if self._selected < len(self._entries) - 1:
-                    self._selected += 1
-                    # Adjust scroll if needed
-                    if self._selected >= self._scroll_offset + MAX_VISIBLE_ITEMS:
-                        self._scroll_offset = self._selected - MAX_VISIBLE_ITEMS + 1
-                    self.on_view()
-                event.status = True
-                return
-
-            if key in (KeyCode.KEYCODE_ENTER, KEY_NAV_RIGHT):
-                self._enter_selected()
-                event.status = True
-                return
-
-            # I = Show info
-            if key == ord("i") or key == ord("I"):
-                self._view_mode = "info"
-                self.on_view()
-                event.status = True
-                return
+    def _show_info(self):
+        self._view_mode = "info"
+        self.on_view()
 
-            # R = Refresh directory
-            if key == ord("r") or key == ord("R"):
-                self._load_directory()
-                self.on_view()
-                event.status = True
-                return
+    def _refresh_list(self):
+        # R = Refresh directory (bypass the cached listing and rescan).
+        # On SD, remount the filesystem too in case the card was swapped,
+        # and forget every /sd listing, not just this one
+        mounted = True
+        if self._storage_is_sd:
+            self._forget_sd_caches()
+            mounted = self._remount_sd()
+        if mounted:
+            self._load_directory(force=True)
+        else:
+            self._entries = []
+            self._selected = 0
+            self._scroll_offset = 0
+        self.on_view()
+
+    # File viewer scrolling (title and footer don't change, so body only)
+    def _viewer_up(self):
+        if self._content_offset > 0:
+            self._content_offset -= 1
+            self._draw_viewer_content()
+
+    def _viewer_down(self):
+        if self._content_offset < len(self._file_content) - 1:
+            self._content_offset += 1
+            self._draw_viewer_content()
+
+    def _viewer_right(self):
+        # Scroll right (show more of long lines), but not past the longest
+        if self._content_h_offset + VIEWER_COLS < self._max_line_len:
+            self._content_h_offset += 10
+            self._draw_viewer_content()
+
+    def _viewer_left(self):
+        if self._content_h_offset > 0:
+            self._content_h_offset = max(0, self._content_h_offset - 10)
+            self._draw_viewer_content()
+
+    def _build_key_handlers(self):
+        """Map each view mode's keys to their handler methods."""
+        up = (KEY_UP, KEY_NAV_UP)
+        down = (KEY_DOWN, KEY_NAV_DOWN)
+        enter = (KEY_ENTER, KEY_NAV_RIGHT)
+        esc = (KEY_ESC,)
+        back = (KEY_BACKSPACE,)
+
+        return {
+            "selector": key_map(
+                (up, self._selector_up),
+                (down, self._selector_down),
+                (enter, self._selector_open),
+                ((ord("r"), ord("R")), self._selector_rescan),
+            ),
+            "list": key_map(
+                (esc, self._leave_list),
+                # Backspace or comma go up (comma scrolls in the viewer)
+                ((KEY_BACKSPACE, KEY_NAV_LEFT), self._navigate_up),
+                (up, self._list_up),
+                (down, self._list_down),
+                (enter, self._enter_selected),
+                ((ord("i"), ord("I")), self._show_info),
+                ((ord("r"), ord("R")), self._refresh_list),
+            ),
+            "viewer": key_map(
+                (esc + back, self._back_to_list),
+                (up, self._viewer_up),
+                (down, self._viewer_down),
+                ((KEY_RIGHT, KEY_NAV_RIGHT), self._viewer_right),
+                ((KEY_LEFT, KEY_NAV_LEFT), self._viewer_left),
+            ),
+            "info": {},  # Any key returns to the list (see _kb_event_handler)
+        }
+
+    async def _kb_event_handler(self, event, fw):
+        """Handle keyboard events."""
+        key = event.key
+        mode = self._view_mode
+
+        # In selector mode, let framework handle ESC to exit app
+        if mode == "selector" and key == KEY_ESC:
+            return
 
+        # One dict lookup per keypress instead of walking an if/elif chain
+        handler = self._key_handlers[mode].get(key)
+        if handler is None and mode == "info":
+            handler = self._back_to_list
+        if handler is not None:
+            handler()
         event.status = True
 
     async def on_run(self):
-        """Background task."""
-        while True:
-            await asyncio.sleep_ms(100)
+        """Background task - none needed, so park for good."""
+        # Everything here is key-driven; waiting on an event nothing sets
+        # avoids waking up every 100ms to do nothing
+        await asyncio.Event().wait()
 
     def on_exit(self):
         """Clean up resources."""
+        self._cancel_load()
         if self._sd_mounted:
             self._unmount_sd()
+        self._cleanup_sd()  # Only place the card is released
+        if self._row_canvas:
+            self._row_canvas.delete()
+            self._row_canvas = None
 
 
 # Export for framework discovery
@@ -43,6 +43,10 @@ class TabBase:
     Each tab should implement:
     - draw(app): Draw the tab content
     - handle_key(app, key): Handle key press, return True if handled
+
+    And may implement:
+    - flush(app): Paint updates deferred by handle_key (called after the
+      tab calls app.request_flush())
     """
 
     def draw(self, app):
@@ -52,3 +56,7 @@ class TabBase:
     def handle_key(self, app, key):
         """Handle key press. Return True if handled. Override in subclass."""
         return False
+
+    def flush(self, app):
+        """Paint any deferred updates. Override in subclass."""
+        pass
@@ -6,8 +6,13 @@ Sub-tab UI:
 - [A]P - Access Point mode (create a hotspot)
 
 Each interface can be toggled on/off independently with [O].
+
+In STA, [S] shows the last scan if it is recent; Shift+[S] always rescans.
 """
 
+import time
+
+from keycode import KEY_NAV_DOWN, KEY_NAV_UP, KeyCode, key_map
 from M5 import Lcd, Widgets
 
 from . import (
@@ -34,6 +39,34 @@ VIEW_MAIN = 0  # Main sub-tab view
 VIEW_STA_PASSWORD = 1  # STA password input
 VIEW_AP_EDITOR = 2  # AP config editor
 
+# Control hints shown on the bottom line of each main view
+CTRL_STA_OFF = "[O]n"
+CTRL_STA_DISCONNECTED = "[O]ff [S]can [C]onnect saved"
+CTRL_STA_CONNECTED = "[O]ff [S]can [D]isconnect"
+CTRL_AP_OFF = "[O]n [E]dit"
+CTRL_AP_ON = "[O]ff [E]dit [R]efresh"
+
+# A scan result is reused for this long before [S] scans again. When
+# connected the list is rarely needed, so it's kept longer.
+SCAN_TTL_CONNECTED_MS = 60000
+SCAN_TTL_DISCONNECTED_MS = 10000
+
+# Network list layout
+NET_LIST_Y = CONTENT_Y + 32
+NET_ROW_H = 16
+MAX_VISIBLE_NETWORKS = 3
+
+# Highlightable rows (network list, AP editor fields) are composed in an
+# off-screen canvas of this size and pushed to the panel in one go
+ROW_X = 5
+ROW_W = SCREEN_W - 10
+ROW_H = 14
+
+# Masked password box text: the last n+1 chars are n stars plus the cursor,
+# so each keystroke is one slice instead of a repeat, concat and slice
+# (29 stars + cursor fill the 30 columns of the box)
+PW_MASK = "*" * 29 + "_"
+
 
 class WiFiTab(TabBase):
     """WiFi configuration tab with independent STA/AP control."""
@@ -44,24 +77,67 @@ class WiFiTab(TabBase):
         self._view = VIEW_MAIN
         # STA state
         self._networks = []
+        # Per-row display fields, filled once per scan by _set_networks
+        self._net_labels = []  # SSID truncated to the row width
+        self._net_bars = []  # Signal bar count (1-4)
+        self._net_secs = []  # "Open" / "WPA"
+        self._connected_idx = -1  # Row of the connected network, -1 if none
+        # AP client display lines (None = re-read on next AP draw)
+        self._ap_clients = None
+        self._ap_clients_label = ""  # "Clients: N"
         self._selected = 0
+        self._net_scroll = 0  # First network row shown
         self._scanning = False
+        self._scan_ts = 0  # ticks_ms of the last completed scan
+        self._scan_connected = False  # STA connection state at that scan
         self._password = ""
+        self._password_display = "_"  # Masked form, kept in step by _set_password
         # AP editor state
         self._ap_field = 0  # 0=SSID, 1=Password
         self._ap_ssid_edit = ""
         self._ap_password_edit = ""
+        # (active, inactive) row text per AP editor field, kept in step by
+        # _set_ap_edit so field repaints don't rebuild strings
+        self._ap_field_text = [("", ""), ("", "")]
+        self._row_canvas = None  # Created on first row draw
+        self._last_sig = None  # _state_sig() of the last full draw
+        self._field_dirty = False  # Typed edits awaiting flush()
+        # Key code -> handler tables, built once so a keypress is one dict
+        # lookup instead of a chain of ord() comparisons
+        self._build_key_tables()
+
+    def on_enter(self):
+        """Re-read the AP client list when the tab is shown again."""
+        self._ap_clients = None
+
+    def on_exit(self):
+        """Free the row canvas, power off a paused STA (called by SettingsApp.on_exit)."""
+        if self._wifi:
+            self._wifi.sta_power_off_if_paused()
+        if self._row_canvas:
+            self._row_canvas.delete()
+            self._row_canvas = None
+
+    def _get_row_canvas(self):
+        """Get the off-screen row buffer, creating it on first use."""
+        if self._row_canvas is None:
+            self._row_canvas = Lcd.newCanvas(ROW_W, ROW_H)
+            self._row_canvas.setFont(Widgets.FONTS.ASCII7)
+            self._row_canvas.setTextSize(1)
+        return self._row_canvas
 
     def _get_wifi(self):
-        """Get WiFiManager instance (always fresh for hot-reload support)."""
+        """Get WiFiManager instance (cached after the first successful load)."""
+        # Draws and key events call this constantly; once cached, skip the
+        # import and singleton lookup entirely
+        if self._wifi is not None:
+            return self._wifi
         try:
             from wifi_manager import get_wifi_manager
 
             wifi = get_wifi_manager()
-            # Load config on first access (check if already loaded)
-            if self._wifi is None:
-                wifi.load_config()
-                self._wifi = wifi
+            wifi.load_config()
+            self._wifi = wifi
             return wifi
         except Exception as e:
             print(f"[wifi_tab] WiFiManager init failed: {e}")
@@ -71,17 +147,49 @@ class WiFiTab(TabBase):
     # Drawing
     # -------------------------------------------------------------------------
 
-    def _redraw(self, app):
-        """Clear content area and redraw."""
+    def _redraw(self, app, force=False):
+        """Clear content area and redraw, unless nothing visible changed.
+
+        Pass force=True after painting a transient message over the content
+        (or when the view shows live data, like AP clients) - the state
+        signature can't see those.
+        """
+        sig = self._state_sig(self._get_wifi())
+        if not force and sig is not None and sig == self._last_sig:
+            return
         Lcd.fillRect(0, CONTENT_Y, SCREEN_W, CONTENT_H, BLACK)
         self.draw(app)
 
+    def _state_sig(self, wifi):
+        """Fingerprint of everything draw() shows (None if WiFi unavailable)."""
+        if not wifi:
+            return None
+        # Row and field repaints keep the screen in step with this state, so
+        # an equal signature means the screen already shows it
+        return (
+            self._view,
+            self._subtab,
+            self._selected,
+            self._net_scroll,
+            self._networks,  # Compared by content (a short list of tuples)
+            self._scanning,
+            wifi.sta_is_enabled(),
+            wifi.sta_is_connected(),
+            wifi.ap_is_enabled(),
+            len(self._password),
+            self._ap_field,
+            self._ap_ssid_edit,
+            self._ap_password_edit,
+        )
+
     def draw(self, app):
         """Draw WiFi tab content based on current sub-tab and view."""
-        Lcd.setFont(Widgets.FONTS.ASCII7)
-        Lcd.setTextSize(1)
-
+        # No setFont/setTextSize here: SettingsApp._draw_tabs sets ASCII7 at
+        # size 1 before every full view, and nothing in this tab changes it,
+        # so _redraw doesn't need to re-issue them on every keystroke
         wifi = self._get_wifi()
+        self._last_sig = self._state_sig(wifi)
+        self._field_dirty = False  # A full draw includes the input fields
         if not wifi:
             Lcd.setTextColor(RED, BLACK)
             Lcd.setCursor(10, CONTENT_Y + 30)
@@ -99,6 +207,12 @@ class WiFiTab(TabBase):
             else:
                 self._draw_ap_view(wifi)
 
+    def _draw_controls(self, text):
+        """Draw the control hint line at the bottom of a main view."""
+        Lcd.setTextColor(GRAY, BLACK)
+        Lcd.setCursor(5, CONTENT_Y + 80)
+        Lcd.print(text)
+
     def _draw_subtab_bar(self):
         """Draw sub-tab navigation bar."""
         y = CONTENT_Y + 2
@@ -151,10 +265,7 @@ class WiFiTab(TabBase):
         Lcd.setCursor(45, y + 40)
         Lcd.print("Press [O] to enable")
 
-        # Controls
-        Lcd.setTextColor(GRAY, BLACK)
-        Lcd.setCursor(5, CONTENT_Y + 80)
-        Lcd.print("[O]n")
+        self._draw_controls(CTRL_STA_OFF)
 
     def _draw_sta_disconnected_view(self, wifi):
         """Draw STA on but not connected view."""
@@ -164,13 +275,10 @@ class WiFiTab(TabBase):
         Lcd.setCursor(5, y)
         Lcd.print("Status: Not connected")
 
-        # Network list
-        self._draw_network_list(y + 14)
+        # Network list (nothing to mark while disconnected)
+        self._draw_network_list(None)
 
-        # Controls
-        Lcd.setTextColor(GRAY, BLACK)
-        Lcd.setCursor(5, CONTENT_Y + 80)
-        Lcd.print("[O]ff [S]can [C]onnect saved")
+        self._draw_controls(CTRL_STA_DISCONNECTED)
 
     def _draw_sta_connected_view(self, wifi):
         """Draw STA connected view."""
@@ -185,59 +293,80 @@ class WiFiTab(TabBase):
         Lcd.print(f"IP: {ip}")
 
         # Network list
-        self._draw_network_list(y + 14)
-
-        # Controls
-        Lcd.setTextColor(GRAY, BLACK)
-        Lcd.setCursor(5, CONTENT_Y + 80)
-        Lcd.print("[O]ff [S]can [D]isconnect")
+        self._draw_network_list(wifi.sta_get_ssid())
 
-    def _draw_network_list(self, start_y):
-        """Draw the scanned network list."""
-        wifi = self._get_wifi()
-        max_visible = 3
+        self._draw_controls(CTRL_STA_CONNECTED)
 
+    def _draw_network_list(self, connected_ssid):
+        """Draw the scanned network list, marking connected_ssid (or None)."""
         if self._scanning:
             Lcd.setTextColor(YELLOW, BLACK)
-            Lcd.setCursor(80, start_y + 15)
+            Lcd.setCursor(80, NET_LIST_Y + 15)
             Lcd.print("Scanning...")
             return
 
         if not self._networks:
             Lcd.setTextColor(GRAY, BLACK)
-            Lcd.setCursor(50, start_y + 15)
+            Lcd.setCursor(50, NET_LIST_Y + 15)
             Lcd.print("Press [S] to scan")
             return
 
-        start_idx = max(0, self._selected - max_visible + 1)
-        for i in range(min(max_visible, len(self._networks) - start_idx)):
-            idx = start_idx + i
-            ssid, rssi, security = self._networks[idx]
-            ny = start_y + i * 16
-
-            if idx == self._selected:
-                Lcd.fillRect(5, ny, SCREEN_W - 10, 14, DARK_GRAY)
-                Lcd.setTextColor(WHITE, DARK_GRAY)
-            else:
-                Lcd.setTextColor(GRAY, BLACK)
-
-            bars = self._rssi_to_bars(rssi)
-            self._draw_signal_bars(10, ny + 2, bars)
-
-            ssid_display = ssid[:16] if len(ssid) > 16 else ssid
-            Lcd.setCursor(30, ny + 3)
-            Lcd.print(ssid_display)
-
-            sec_str = "Open" if security == 0 else "WPA"
-            Lcd.setCursor(150, ny + 3)
-            Lcd.print(sec_str)
-
-            # Mark connected network
-            connected_ssid = wifi.sta_get_ssid() if wifi.sta_is_connected() else None
-            if ssid == connected_ssid:
-                Lcd.setTextColor(GREEN, DARK_GRAY if idx == self._selected else BLACK)
-                Lcd.setCursor(185, ny + 3)
-                Lcd.print("*")
+        # The caller already knows the connection state (_draw_sta_view
+        # branched on it), so find the marked row from that; single-row
+        # repaints reuse it instead of asking the radio
+        self._connected_idx = -1
+        for i, net in enumerate(self._networks):
+            if net[0] == connected_ssid:
+                self._connected_idx = i
+                break
+
+        end = min(self._net_scroll + MAX_VISIBLE_NETWORKS, len(self._networks))
+        for idx in range(self._net_scroll, end):
+            self._draw_network_row(idx)
+
+    def _draw_network_row(self, idx):
+        """Draw one visible network row (also used to repaint just that row)."""
+        ny = NET_LIST_Y + (idx - self._net_scroll) * NET_ROW_H
+        selected = idx == self._selected
+
+        # Compose the row off-screen (coordinates relative to the row), then
+        # push it in one transfer - no flicker when only this row changes
+        c = self._get_row_canvas()
+        bg = DARK_GRAY if selected else BLACK
+        c.fillScreen(bg)
+        c.setTextColor(WHITE if selected else GRAY, bg)
+
+        self._draw_signal_bars(c, 5, 2, self._net_bars[idx])
+
+        c.setCursor(25, 3)
+        c.print(self._net_labels[idx])
+
+        c.setCursor(145, 3)
+        c.print(self._net_secs[idx])
+
+        # Mark connected network
+        if idx == self._connected_idx:
+            c.setTextColor(GREEN, bg)
+            c.setCursor(180, 3)
+            c.print("*")
+
+        c.push(ROW_X, ny)
+
+    def _move_network_selection(self, app, delta):
+        """Move the list selection, repainting only the rows that changed."""
+        old = self._selected
+        self._selected += delta
+
+        # Scrolling shifts every row, so that still needs a full redraw
+        if self._selected < self._net_scroll:
+            self._net_scroll = self._selected
+        elif self._selected >= self._net_scroll + MAX_VISIBLE_NETWORKS:
+            self._net_scroll = self._selected - MAX_VISIBLE_NETWORKS + 1
+        else:
+            self._draw_network_row(old)
+            self._draw_network_row(self._selected)
+            return
+        self._redraw(app)
 
     def _draw_sta_password(self):
         """Draw STA password input screen."""
@@ -253,11 +382,7 @@ class WiFiTab(TabBase):
         Lcd.setCursor(10, CONTENT_Y + 25)
         Lcd.print("Password:")
 
-        Lcd.fillRect(10, CONTENT_Y + 40, SCREEN_W - 20, 16, DARK_GRAY)
-        Lcd.drawRect(10, CONTENT_Y + 40, SCREEN_W - 20, 16, WHITE)
-        Lcd.setCursor(14, CONTENT_Y + 44)
-        display_pw = "*" * len(self._password) + "_"
-        Lcd.print(display_pw[:30])
+        self._draw_password_field()
 
         Lcd.setTextColor(GRAY, BLACK)
         Lcd.setCursor(10, CONTENT_Y + 65)
@@ -265,6 +390,14 @@ class WiFiTab(TabBase):
         Lcd.setCursor(10, CONTENT_Y + 78)
         Lcd.print("[Bksp] Delete")
 
+    def _draw_password_field(self):
+        """Draw the masked password input box (repainted alone while typing)."""
+        Lcd.fillRect(10, CONTENT_Y + 40, SCREEN_W - 20, 16, DARK_GRAY)
+        Lcd.drawRect(10, CONTENT_Y + 40, SCREEN_W - 20, 16, WHITE)
+        Lcd.setTextColor(WHITE, DARK_GRAY)
+        Lcd.setCursor(14, CONTENT_Y + 44)
+        Lcd.print(self._password_display)
+
     # -------------------------------------------------------------------------
     # AP Views
     # -------------------------------------------------------------------------
@@ -276,7 +409,7 @@ class WiFiTab(TabBase):
         if not ap_on:
             self._draw_ap_off_view(wifi)
         else:
-            clients = wifi.ap_get_clients()
+            clients = self._get_ap_clients(wifi)
             if clients:
                 self._draw_ap_with_clients_view(wifi, clients)
             else:
@@ -303,10 +436,7 @@ class WiFiTab(TabBase):
         Lcd.setCursor(50, y + 45)
         Lcd.print("Press [O] to start")
 
-        # Controls
-        Lcd.setTextColor(GRAY, BLACK)
-        Lcd.setCursor(5, CONTENT_Y + 80)
-        Lcd.print("[O]n [E]dit")
+        self._draw_controls(CTRL_AP_OFF)
 
     def _draw_ap_no_clients_view(self, wifi):
         """Draw AP on with no clients view."""
@@ -327,10 +457,7 @@ class WiFiTab(TabBase):
         Lcd.setCursor(40, y + 35)
         Lcd.print("Waiting for connections...")
 
-        # Controls
-        Lcd.setTextColor(GRAY, BLACK)
-        Lcd.setCursor(5, CONTENT_Y + 80)
-        Lcd.print("[O]ff [E]dit [R]efresh")
+        self._draw_controls(CTRL_AP_ON)
 
     def _draw_ap_with_clients_view(self, wifi, clients):
         """Draw AP on with connected clients view."""
@@ -347,18 +474,26 @@ class WiFiTab(TabBase):
 
         Lcd.setTextColor(CYAN, BLACK)
         Lcd.setCursor(5, y + 14)
-        Lcd.print(f"Clients: {len(clients)}")
+        Lcd.print(self._ap_clients_label)
 
-        # Client list (clients is a list of MAC strings)
-        for i, mac in enumerate(clients[:3]):
+        # Client list (at most 3 MAC strings, see _get_ap_clients)
+        for i, mac in enumerate(clients):
             Lcd.setTextColor(GRAY, BLACK)
             Lcd.setCursor(10, y + 26 + i * 10)
             Lcd.print(mac)
 
-        # Controls
-        Lcd.setTextColor(GRAY, BLACK)
-        Lcd.setCursor(5, CONTENT_Y + 80)
-        Lcd.print("[O]ff [E]dit [R]efresh")
+        self._draw_controls(CTRL_AP_ON)
+
+    def _get_ap_clients(self, wifi):
+        """Get the AP client lines to show, polling the AP only when stale."""
+        # Polling asks the driver for the station list and formats every
+        # MAC, so do it when the list may have changed ([R]efresh, toggle,
+        # entering the sub-tab) rather than on every repaint
+        if self._ap_clients is None:
+            clients = wifi.ap_get_clients()
+            self._ap_clients = clients[:3]
+            self._ap_clients_label = f"Clients: {len(clients)}"
+        return self._ap_clients
 
     def _draw_ap_editor(self):
         """Draw AP configuration editor."""
@@ -366,35 +501,8 @@ class WiFiTab(TabBase):
         Lcd.setCursor(10, CONTENT_Y + 5)
         Lcd.print("AP Configuration")
 
-        y = CONTENT_Y + 25
-
-        # SSID field
-        if self._ap_field == 0:
-            Lcd.fillRect(5, y - 2, SCREEN_W - 10, 14, DARK_GRAY)
-            Lcd.setTextColor(WHITE, DARK_GRAY)
-        else:
-            Lcd.setTextColor(GRAY, BLACK)
-        Lcd.setCursor(10, y)
-        Lcd.print(
-            f"SSID: {self._ap_ssid_edit[:20]}_"
-            if self._ap_field == 0
-            else f"SSID: {self._ap_ssid_edit[:22]}"
-        )
-
-        y += 18
-
-        # Password field
-        if self._ap_field == 1:
-            Lcd.fillRect(5, y - 2, SCREEN_W - 10, 14, DARK_GRAY)
-            Lcd.setTextColor(WHITE, DARK_GRAY)
-        else:
-            Lcd.setTextColor(GRAY, BLACK)
-        Lcd.setCursor(10, y)
-        pw_display = "*" * len(self._ap_password_edit)
-        if self._ap_field == 1:
-            Lcd.print(f"Pass: {pw_display[:20]}_")
-        else:
-            Lcd.print(f"Pass: {pw_display[:22]}" if pw_display else "Pass: (open)")
+        self._draw_ap_field(0)
+        self._draw_ap_field(1)
 
         # Controls
         Lcd.setTextColor(GRAY, BLACK)
@@ -403,6 +511,41 @@ class WiFiTab(TabBase):
         Lcd.setCursor(10, CONTENT_Y + 78)
         Lcd.print("[Up/Down] Switch field")
 
+    def _draw_ap_field(self, field):
+        """Draw one AP editor field row (0=SSID, 1=Password)."""
+        y = CONTENT_Y + 25 + field * 18
+        active = field == self._ap_field
+
+        # Same row buffer as the network list (fields are the same size)
+        c = self._get_row_canvas()
+        bg = DARK_GRAY if active else BLACK
+        c.fillScreen(bg)
+        c.setTextColor(WHITE if active else GRAY, bg)
+        c.setCursor(5, 2)
+
+        active_text, inactive_text = self._ap_field_text[field]
+        c.print(active_text if active else inactive_text)
+
+        c.push(ROW_X, y - 2)
+
+    def _set_password(self, password):
+        """Set the STA password input and its masked display form."""
+        self._password = password
+        self._password_display = PW_MASK[-(min(len(password), 29) + 1) :]
+
+    def _set_ap_edit(self, field, value):
+        """Set an AP editor field (0=SSID, 1=Password) and its row text."""
+        if field == 0:
+            self._ap_ssid_edit = value
+            self._ap_field_text[0] = (f"SSID: {value[:20]}_", f"SSID: {value[:22]}")
+        else:
+            self._ap_password_edit = value
+            masked = "*" * len(value)
+            self._ap_field_text[1] = (
+                f"Pass: {masked[:20]}_",
+                f"Pass: {masked[:22]}" if masked else "Pass: (open)",
+            )
+
     # -------------------------------------------------------------------------
     # Helpers
     # -------------------------------------------------------------------------
@@ -417,8 +560,8 @@ class WiFiTab(TabBase):
             return 2
         return 1
 
-    def _draw_signal_bars(self, x, y, bars):
-        """Draw signal strength bars at position."""
+    def _draw_signal_bars(self, gfx, x, y, bars):
+        """Draw signal strength bars at position on gfx (Lcd or a canvas)."""
         bar_w = 3
         gap = 1
         max_h = 10
@@ -427,7 +570,7 @@ class WiFiTab(TabBase):
             bx = x + i * (bar_w + gap)
             by = y + (max_h - h)
             color = GREEN if i < bars else DARK_GRAY
-            Lcd.fillRect(bx, by, bar_w, h, color)
+            gfx.fillRect(bx, by, bar_w, h, color)
 
     # -------------------------------------------------------------------------
     # STA Actions
@@ -439,25 +582,43 @@ class WiFiTab(TabBase):
         if not wifi:
             return
 
+        # Pause rather than power off so toggling back on is instant; the
+        # radio is powered down when leaving Settings (see on_exit)
         if wifi.sta_is_enabled():
-            wifi.sta_disable()
+            wifi.sta_pause()
         else:
             wifi.sta_enable()
         wifi.save_config()
         self._redraw(app)
 
-    def _scan(self, app):
-        """Scan for networks."""
+    def _scan(self, app, force=False):
+        """Scan for networks, reusing a recent result unless force is set."""
         wifi = self._get_wifi()
         if not wifi:
             return
 
+        # An active scan stalls the radio (and this UI) for seconds, so a
+        # recent list is just redrawn - unless the connection state changed
+        # since, in which case the list (and its * marker) may be stale
+        connected = wifi.sta_is_connected()
+        if (
+            not force
+            and self._networks
+            and connected == self._scan_connected
+            and time.ticks_diff(time.ticks_ms(), self._scan_ts) < self._scan_ttl_ms(connected)
+        ):
+            self._redraw(app)
+            return
+
         self._scanning = True
         self._redraw(app)
 
         try:
-            self._networks = wifi.sta_scan()
+            self._set_networks(wifi.sta_scan())
+            self._scan_ts = time.ticks_ms()
+            self._scan_connected = connected
             self._selected = 0
+            self._net_scroll = 0
             print(f"[wifi_tab] Found {len(self._networks)} networks")
         except Exception as e:
             print(f"[wifi_tab] Scan failed: {e}")
@@ -465,6 +626,17 @@ class WiFiTab(TabBase):
             self._scanning = False
             self._redraw(app)
 
+    def _set_networks(self, networks):
+        """Store scan results and precompute their per-row display fields."""
+        self._networks = networks
+        self._net_labels = [net[0][:16] for net in networks]
+        self._net_bars = [self._rssi_to_bars(net[1]) for net in networks]
+        self._net_secs = ["Open" if net[2] == 0 else "WPA" for net in networks]
+
+    def _scan_ttl_ms(self, connected):
+        """How long a scan result stays fresh for the given STA state."""
+        return SCAN_TTL_CONNECTED_MS if connected else SCAN_TTL_DISCONNECTED_MS
+
     def _connect_selected(self, app):
         """Connect to selected network."""
         if not self._networks or self._selected >= len(self._networks):
@@ -474,7 +646,7 @@ class WiFiTab(TabBase):
         if security == 0:
             self._do_connect(app, ssid, "")
         else:
-            self._password = ""
+            self._set_password("")
             self._view = VIEW_STA_PASSWORD
             self._redraw(app)
 
@@ -498,13 +670,11 @@ class WiFiTab(TabBase):
             Lcd.setTextColor(RED, BLACK)
             Lcd.setCursor(50, CONTENT_Y + 40)
             Lcd.print("Connection failed!")
-            import time
-
             time.sleep_ms(1500)
 
         self._view = VIEW_MAIN
-        self._password = ""
-        self._redraw(app)
+        self._set_password("")
+        self._redraw(app, force=True)  # Replaces the "Connecting..." screen
 
     def _connect_saved(self, app):
         """Connect to saved network."""
@@ -522,10 +692,8 @@ class WiFiTab(TabBase):
             Lcd.setTextColor(YELLOW, BLACK)
             Lcd.setCursor(50, CONTENT_Y + 40)
             Lcd.print("No saved network")
-            import time
-
             time.sleep_ms(1000)
-            self._redraw(app)
+            self._redraw(app, force=True)
 
     def _disconnect(self, app):
         """Disconnect from current network."""
@@ -548,6 +716,7 @@ class WiFiTab(TabBase):
             wifi.ap_disable()
         else:
             wifi.ap_enable()
+        self._ap_clients = None
         wifi.save_config()
         self._redraw(app)
 
@@ -555,8 +724,8 @@ class WiFiTab(TabBase):
         """Open AP configuration editor."""
         wifi = self._get_wifi()
         if wifi:
-            self._ap_ssid_edit = wifi.ap_get_ssid()
-            self._ap_password_edit = wifi.ap_get_password() or ""
+            self._set_ap_edit(0, wifi.ap_get_ssid())
+            self._set_ap_edit(1, wifi.ap_get_password() or "")
         self._ap_field = 0
         self._view = VIEW_AP_EDITOR
         self._redraw(app)
@@ -578,10 +747,8 @@ class WiFiTab(TabBase):
                 Lcd.print("Password must be")
                 Lcd.setCursor(20, CONTENT_Y + 50)
                 Lcd.print("8+ chars or empty")
-                import time
-
                 time.sleep_ms(1500)
-                self._redraw(app)
+                self._redraw(app, force=True)
                 return  # Don't save, stay in editor
 
             wifi.ap_set_config(self._ap_ssid_edit, self._ap_password_edit)
@@ -603,156 +770,186 @@ class WiFiTab(TabBase):
         else:
             return self._handle_main_key(app, key)
 
+    def _mark_field_dirty(self, app):
+        """Defer the input field repaint to flush()."""
+        self._field_dirty = True
+        app.request_flush()
+
+    def flush(self, app):
+        """Repaint the input field once for all edits since the last flush."""
+        # Held backspace (or fast typing) then costs one field paint per
+        # FLUSH_MS window instead of one per key event
+        if not self._field_dirty:
+            return
+        self._field_dirty = False
+        if self._view == VIEW_STA_PASSWORD:
+            self._draw_password_field()
+        elif self._view == VIEW_AP_EDITOR:
+            self._draw_ap_field(self._ap_field)
+
+    def _build_key_tables(self):
+        """Build the {key code: handler} table for each key context.
+
+        Handlers take app; returning False means "not handled" (so the
+        settings app may use the key), anything else means handled.
+        """
+        self._main_keys = key_map(
+            # Sub-tab switching: S for STA, A for AP
+            ((ord("s"),), self._key_s),
+            ((ord("S"),), self._key_shift_s),
+            ((ord("a"), ord("A")), self._key_a),
+            # [O] - Toggle on/off for current interface
+            ((ord("o"), ord("O")), self._key_o),
+        )
+        self._sta_keys = key_map(
+            ((KEY_NAV_UP,), self._key_sta_up),
+            ((KEY_NAV_DOWN,), self._key_sta_down),
+            ((KeyCode.KEYCODE_ENTER,), self._connect_selected),
+            ((ord("c"), ord("C")), self._connect_saved),
+            ((ord("d"), ord("D")), self._disconnect),
+        )
+        self._ap_keys = key_map(
+            ((ord("e"), ord("E")), self._open_ap_editor),
+            ((ord("r"), ord("R")), self._key_ap_refresh),
+        )
+        self._password_keys = key_map(
+            ((KeyCode.KEYCODE_ESC,), self._key_password_cancel),
+            ((KeyCode.KEYCODE_BACKSPACE,), self._key_password_backspace),
+            ((KeyCode.KEYCODE_ENTER,), self._key_password_submit),
+        )
+        self._ap_editor_keys = key_map(
+            ((KeyCode.KEYCODE_ESC,), self._key_ap_editor_cancel),
+            ((KEY_NAV_UP, KEY_NAV_DOWN), self._key_ap_editor_switch),
+            ((KeyCode.KEYCODE_ENTER,), self._apply_ap_config),
+            ((KeyCode.KEYCODE_BACKSPACE,), self._key_ap_editor_backspace),
+        )
+
     def _handle_main_key(self, app, key):
         """Handle keys in main view (sub-tab navigation)."""
         wifi = self._get_wifi()
         if not wifi:
             return False
 
-        # Sub-tab switching: S for STA, A for AP
-        if key == ord("s") or key == ord("S"):
-            if self._subtab == SUBTAB_STA:
-                # Already in STA, [S] means scan
-                if wifi.sta_is_enabled():
-                    self._scan(app)
-                    return True
-            else:
-                # Switch to STA sub-tab
-                self._subtab = SUBTAB_STA
-                self._redraw(app)
-                return True
-
-        if key == ord("a") or key == ord("A"):
-            if self._subtab != SUBTAB_AP:
-                self._subtab = SUBTAB_AP
-                self._redraw(app)
-            return True
-
-        # [O] - Toggle on/off for current interface
-        if key == ord("o") or key == ord("O"):
+        handler = self._main_keys.get(key)
+        if handler is None:
+            # Context-specific keys
             if self._subtab == SUBTAB_STA:
-                self._sta_toggle(app)
+                if not wifi.sta_is_enabled():
+                    return False
+                handler = self._sta_keys.get(key)
             else:
-                self._ap_toggle(app)
-            return True
+                handler = self._ap_keys.get(key)
+            if handler is None:
+                return False
+        return handler(app) is not False
+
+    # Main view keys
 
-        # Context-specific keys
+    def _key_s(self, app, force=False):
         if self._subtab == SUBTAB_STA:
-            return self._handle_sta_keys(app, key, wifi)
+            # Already in STA, [S] means scan (Shift+S skips the cache)
+            if not self._get_wifi().sta_is_enabled():
+                return False
+            self._scan(app, force=force)
         else:
-            return self._handle_ap_keys(app, key)
-
-    def _handle_sta_keys(self, app, key, wifi):
-        """Handle keys in STA sub-tab."""
-        from keycode import KEY_NAV_DOWN, KEY_NAV_UP, KeyCode
+            # Switch to STA sub-tab
+            self._subtab = SUBTAB_STA
+            self._redraw(app)
 
-        if not wifi.sta_is_enabled():
-            return False
+    def _key_shift_s(self, app):
+        return self._key_s(app, force=True)
 
-        if key == KEY_NAV_UP:
-            if self._networks and self._selected > 0:
-                self._selected -= 1
-                self._redraw(app)
-            return True
-
-        if key == KEY_NAV_DOWN:
-            if self._networks and self._selected < len(self._networks) - 1:
-                self._selected += 1
-                self._redraw(app)
-            return True
-
-        if key == KeyCode.KEYCODE_ENTER:
-            if self._networks:
-                self._connect_selected(app)
-            return True
-
-        if key == ord("c") or key == ord("C"):
-            self._connect_saved(app)
-            return True
-
-        if key == ord("d") or key == ord("D"):
-            self._disconnect(app)
-            return True
-
-        return False
-
-    def _handle_ap_keys(self, app, key):
-        """Handle keys in AP sub-tab."""
-        if key == ord("e") or key == ord("E"):
-            self._open_ap_editor(app)
-            return True
-        if key == ord("r") or key == ord("R"):
-            # Refresh AP view (updates client list)
+    def _key_a(self, app):
+        if self._subtab != SUBTAB_AP:
+            self._subtab = SUBTAB_AP
+            self._ap_clients = None
             self._redraw(app)
-            return True
-        return False
 
-    def _handle_password_key(self, app, key):
-        """Handle keys in password input view."""
-        from keycode import KeyCode
+    def _key_o(self, app):
+        if self._subtab == SUBTAB_STA:
+            self._sta_toggle(app)
+        else:
+            self._ap_toggle(app)
 
-        # ESC returns to STA view (not exit WiFi tab)
-        if key == KeyCode.KEYCODE_ESC:
-            self._view = VIEW_MAIN
-            self._password = ""
-            self._redraw(app)
-            return True
+    # STA sub-tab keys
 
-        if key == KeyCode.KEYCODE_BACKSPACE:
-            if self._password:
-                self._password = self._password[:-1]
-                self._redraw(app)
-            return True
+    def _key_sta_up(self, app):
+        if self._networks and self._selected > 0:
+            self._move_network_selection(app, -1)
 
-        if key == KeyCode.KEYCODE_ENTER:
-            ssid = self._networks[self._selected][0]
-            self._do_connect(app, ssid, self._password)
-            return True
+    def _key_sta_down(self, app):
+        if self._networks and self._selected < len(self._networks) - 1:
+            self._move_network_selection(app, 1)
 
-        if 32 <= key <= 126:
-            self._password += chr(key)
-            self._redraw(app)
-            return True
+    # AP sub-tab keys
 
-        return True
+    def _key_ap_refresh(self, app):
+        # Refresh AP view (updates client list)
+        self._ap_clients = None
+        self._redraw(app, force=True)
 
-    def _handle_ap_editor_key(self, app, key):
-        """Handle keys in AP editor view."""
-        from keycode import KEY_NAV_DOWN, KEY_NAV_UP, KeyCode
+    # Password input keys
 
-        # ESC returns to AP view (not exit WiFi tab)
-        if key == KeyCode.KEYCODE_ESC:
-            self._view = VIEW_MAIN
-            self._redraw(app)
-            return True
+    def _handle_password_key(self, app, key):
+        """Handle keys in password input view."""
+        handler = self._password_keys.get(key)
+        if handler is not None:
+            handler(app)
+        elif 32 <= key <= 126:
+            # Typing only changes the input box; flush() repaints just that
+            self._set_password(self._password + chr(key))
+            self._mark_field_dirty(app)
+        return True
 
-        if key in (KEY_NAV_UP, KEY_NAV_DOWN):
-            self._ap_field = 1 - self._ap_field
-            self._redraw(app)
-            return True
+    def _key_password_cancel(self, app):
+        # ESC returns to STA view (not exit WiFi tab)
+        self._view = VIEW_MAIN
+        self._set_password("")
+        self._redraw(app)
 
-        if key == KeyCode.KEYCODE_ENTER:
-            self._apply_ap_config(app)
-            return True
+    def _key_password_backspace(self, app):
+        if self._password:
+            self._set_password(self._password[:-1])
+            self._mark_field_dirty(app)
 
-        if key == KeyCode.KEYCODE_BACKSPACE:
-            if self._ap_field == 0:
-                if self._ap_ssid_edit:
-                    self._ap_ssid_edit = self._ap_ssid_edit[:-1]
-            else:
-                if self._ap_password_edit:
-                    self._ap_password_edit = self._ap_password_edit[:-1]
-            self._redraw(app)
-            return True
+    def _key_password_submit(self, app):
+        ssid = self._networks[self._selected][0]
+        self._do_connect(app, ssid, self._password)
+
+    # AP editor keys
 
-        if 32 <= key <= 126:
+    def _handle_ap_editor_key(self, app, key):
+        """Handle keys in AP editor view."""
+        handler = self._ap_editor_keys.get(key)
+        if handler is not None:
+            handler(app)
+        elif 32 <= key <= 126:
+            # Typing only touches the active field row; flush() repaints it
             if self._ap_field == 0:
                 if len(self._ap_ssid_edit) < 32:
-                    self._ap_ssid_edit += chr(key)
+                    self._set_ap_edit(0, self._ap_ssid_edit + chr(key))
             else:
                 if len(self._ap_password_edit) < 63:
-                    self._ap_password_edit += chr(key)
-            self._redraw(app)
-            return True
-
+                    self._set_ap_edit(1, self._ap_password_edit + chr(key))
+            self._mark_field_dirty(app)
         return True
+
+    def _key_ap_editor_cancel(self, app):
+        # ESC returns to AP view (not exit WiFi tab)
+        self._view = VIEW_MAIN
+        self._redraw(app)
+
+    def _key_ap_editor_switch(self, app):
+        # Field switches only touch the two field rows
+        self._ap_field = 1 - self._ap_field
+        self._draw_ap_field(0)
+        self._draw_ap_field(1)
+
+    def _key_ap_editor_backspace(self, app):
+        if self._ap_field == 0:
+            if self._ap_ssid_edit:
+                self._set_ap_edit(0, self._ap_ssid_edit[:-1])
+        else:
+            if self._ap_password_edit:
+                self._set_ap_edit(1, self._ap_password_edit[:-1])
+        self._mark_field_dirty(app)
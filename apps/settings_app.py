@@ -55,6 +55,9 @@ TAB_ABOUT = 4
 # Footer
 FOOTER_Y = SCREEN_H - 12
 
+# How long after a request_flush() tabs may coalesce key-repeat repaints
+FLUSH_MS = 30
+
 
 class SettingsApp(AppBase):
     """
@@ -66,6 +69,7 @@ class SettingsApp(AppBase):
         self.name = "Settings"
         self._current_tab = 0
         self._tabs = {}  # Lazy-loaded tab instances
+        self._flush_event = asyncio.Event()  # Set by request_flush()
         print("[settings] App initialized")
 
     def _get_tab(self, index):
@@ -228,10 +232,28 @@ class SettingsApp(AppBase):
 
         event.status = True
 
+    def on_exit(self):
+        """Let loaded tabs free their resources."""
+        for tab in self._tabs.values():
+            if hasattr(tab, "on_exit"):
+                tab.on_exit()
+
+    def request_flush(self):
+        """Have on_run call the current tab's flush() within FLUSH_MS."""
+        self._flush_event.set()
+
     async def on_run(self):
-        """Background task loop."""
+        """Background task loop: flush deferred tab repaints on request."""
+        # Parks while no tab has deferred work, so idle tabs cost no
+        # wakeups; once woken, waiting FLUSH_MS lets a burst of repeated
+        # keys land before the single repaint
         while True:
-            await asyncio.sleep_ms(100)
+            await self._flush_event.wait()
+            await asyncio.sleep_ms(FLUSH_MS)
+            self._flush_event.clear()
+            tab = self._tabs.get(self._current_tab)
+            if tab:
+                tab.flush(self)
 
 
 # Export for framework
@@ -121,3 +121,20 @@ def decode_modifiers(mask):
     if mask & KEY_MOD_RMETA:
         mods.append("ROpt")
     return "+".join(mods) if mods else ""
+
+
+def key_map(*bindings):
+    """
+    Expand (key codes, handler) pairs into a {key code: handler} dict.
+
+    Args:
+        bindings: (iterable of key codes, handler) tuples
+
+    Returns:
+        Dict mapping each key code to its handler
+    """
+    table = {}
+    for keys, handler in bindings:
+        for key in keys:
+            table[key] = handler
+    return table
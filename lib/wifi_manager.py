@@ -6,7 +6,12 @@ with NVS persistence. Used by wifi_tab.py, boot.py, and other apps
 needing WiFi functionality.
 """
 
+import binascii
+import time
+
+import esp32
 import network
+from micropython import const
 from wifi_constants import (
     DEFAULT_AP_IP,
     DEFAULT_AP_PASSWORD,
@@ -20,36 +25,88 @@ from wifi_constants import (
     NVS_NAMESPACE,
 )
 
+# Set to 1 to log routine state changes (enable/disable, connect, config
+# load/save). Each print blocks on the console; with 0 the compiler drops
+# the gated prints entirely. Failures are always printed.
+_DEBUG = const(0)
+
+# sta_connect() polling: start fast so link-up is seen quickly, back off
+# to spare wakeups while DHCP or a slow AP takes its time
+CONNECT_POLL_MIN_MS = 10
+CONNECT_POLL_MAX_MS = 200
+
+# Driver retries for a connect request. The ESP32 port retries forever by
+# default and reports STAT_CONNECTING throughout, so the failure status
+# checked in sta_connect() would only show once the timeout ran out
+CONNECT_RECONNECTS = 2
+
+# How long a STA state snapshot may be reused. UI draws ask for enabled /
+# connected / IP / SSID several times per frame; within this window they
+# share one round of driver calls
+STA_STATUS_MAX_AGE_MS = 500
+
+# Shared read buffer for NVS string blobs (SSIDs are <= 32 bytes, WPA2
+# passwords <= 63), so loading config doesn't allocate one per key
+_NVS_BUF = bytearray(64)
+_NVS_MV = memoryview(_NVS_BUF)
+
+
+def _ap_authmode(password):
+    """AP authmode for a password: open if empty, WPA2 if 8+ chars, else None."""
+    if not password:
+        return network.AUTH_OPEN
+    # WPA2 requires minimum 8 character password
+    if len(password) >= 8:
+        return network.AUTH_WPA_WPA2_PSK
+    return None
+
+
+def _read_blob_str(nvs, key, default):
+    """Read a UTF-8 blob from NVS; default if empty. Raises OSError if unset."""
+    length = nvs.get_blob(key, _NVS_BUF)
+    # str() decodes straight from the buffer, without an interim bytes copy
+    return str(_NVS_MV[:length], "utf-8") if length else default
+
 
 class WiFiManager:
     """Manages WiFi STA and AP interfaces independently."""
 
     def __init__(self):
-        self._sta = None
-        self._ap = None
+        # Interfaces are created up front: boot restore touches both anyway,
+        # and every method can then use them without a lazy accessor call
+        self._sta = network.WLAN(network.STA_IF)
+        self._ap = network.WLAN(network.AP_IF)
         self._sta_enabled = False
+        # STA switched off via sta_pause(): radio still powered, but it
+        # reads as disabled until sta_enable() or sta_power_off()
+        self._sta_paused = False
         self._ap_enabled = False
         # Cached credentials (loaded from NVS)
         self._sta_ssid = None
         self._sta_password = None
         self._ap_ssid = DEFAULT_AP_SSID
         self._ap_password = DEFAULT_AP_PASSWORD
+        self._ap_authmode = _ap_authmode(DEFAULT_AP_PASSWORD)  # See _set_ap_password
+        # Station query methods to try in ap_get_clients(), narrowed to the
+        # one that works; (raw stations, MAC strings) from the last poll
+        self._ap_stations_keys = ("status", "config")
+        self._ap_clients_cache = None
+        self._nvs = None  # NVS namespace handle, opened on first use
+        # NVS key -> value as last loaded from / committed to NVS, so
+        # save_config() only rewrites keys that changed
+        self._nvs_saved = {}
+        # (ticks_ms, active, connected, ip, ssid), see _sta_status()
+        self._sta_snap = None
 
     # -------------------------------------------------------------------------
-    # Interface accessors (lazy initialization)
+    # NVS handle (lazy initialization)
     # -------------------------------------------------------------------------
 
-    def _get_sta(self):
-        """Get or create STA interface."""
-        if self._sta is None:
-            self._sta = network.WLAN(network.STA_IF)
-        return self._sta
-
-    def _get_ap(self):
-        """Get or create AP interface."""
-        if self._ap is None:
-            self._ap = network.WLAN(network.AP_IF)
-        return self._ap
+    def _get_nvs(self):
+        """Get or open the NVS namespace handle."""
+        if self._nvs is None:
+            self._nvs = esp32.NVS(NVS_NAMESPACE)
+        return self._nvs
 
     # -------------------------------------------------------------------------
     # STA enable/disable
@@ -57,24 +114,80 @@ class WiFiManager:
 
     def sta_enable(self):
         """Enable STA interface (radio on)."""
-        sta = self._get_sta()
-        sta.active(True)
+        sta = self._sta
+        # After sta_pause() the radio is still up; skip the driver restart
+        if not sta.active():
+            sta.active(True)
         self._sta_enabled = True
-        print("[wifi] STA enabled")
+        self._sta_paused = False
+        self._sta_snap = None
+        if _DEBUG:
+            print("[wifi] STA enabled")
+
+    def sta_pause(self):
+        """
+        Disable STA but keep the radio powered (disconnects if connected).
+
+        Powering the radio down and back up costs a driver restart, so UI
+        toggles use this; call sta_power_off_if_paused() once done.
+        """
+        sta = self._sta
+        paused = sta.active()
+        if paused:
+            # Unconditional: also cancels a connect in progress or the
+            # driver's reconnect attempts after a dropped link
+            sta.disconnect()
+        self._sta_enabled = False
+        self._sta_paused = paused
+        self._sta_snap = None
+        if _DEBUG:
+            print("[wifi] STA paused")
 
     def sta_disable(self):
         """Disable STA interface (radio off, disconnects if connected)."""
-        sta = self._get_sta()
-        if sta.isconnected():
-            sta.disconnect()
-        sta.active(False)
+        sta = self._sta
+        if sta.active():
+            if sta.isconnected():
+                sta.disconnect()
+            sta.active(False)
         self._sta_enabled = False
-        print("[wifi] STA disabled")
+        self._sta_paused = False
+        self._sta_snap = None
+        if _DEBUG:
+            print("[wifi] STA disabled")
+
+    def sta_power_off_if_paused(self):
+        """Power the radio down if STA was left paused by sta_pause()."""
+        if self._sta_paused:
+            self.sta_disable()
 
     def sta_is_enabled(self):
-        """Check if STA interface is enabled."""
-        sta = self._get_sta()
-        return sta.active()
+        """Check if STA interface is enabled (a paused STA reads as off)."""
+        return self._sta_status()[1] and not self._sta_paused
+
+    def _sta_status(self):
+        """
+        Snapshot STA state as (ticks_ms, active, connected, ip, ssid).
+
+        Reuses the last snapshot for up to STA_STATUS_MAX_AGE_MS; methods
+        that change STA state reset it so callers see the change at once.
+        """
+        snap = self._sta_snap
+        now = time.ticks_ms()
+        if snap is None or time.ticks_diff(now, snap[0]) >= STA_STATUS_MAX_AGE_MS:
+            sta = self._sta
+            active = sta.active()
+            connected = active and sta.isconnected()
+            ip = None
+            ssid = None
+            if connected:
+                ip = sta.ifconfig()[0]
+                try:
+                    ssid = sta.config("essid")
+                except Exception:
+                    ssid = self._sta_ssid
+            snap = self._sta_snap = (now, active, connected, ip, ssid)
+        return snap
 
     # -------------------------------------------------------------------------
     # STA operations
@@ -88,23 +201,24 @@ class WiFiManager:
             List of tuples: (ssid, rssi, security)
             Sorted by signal strength (strongest first).
         """
-        sta = self._get_sta()
+        sta = self._sta
         if not sta.active():
             sta.active(True)
             self._sta_enabled = True
-            import time
-
+            self._sta_snap = None
             time.sleep_ms(500)
+        elif self._sta_paused:
+            # Scanning re-enables a paused STA, as it does a powered-off one
+            self._sta_enabled = True
+            self._sta_paused = False
+            self._sta_snap = None
 
         try:
             networks = sta.scan()
-            result = []
-            for net in networks:
-                ssid = net[0].decode("utf-8") if isinstance(net[0], bytes) else net[0]
-                rssi = net[3]
-                security = net[4]
-                if ssid:
-                    result.append((ssid, rssi, security))
+            # scan() tuples are (ssid, bssid, channel, rssi, security, hidden)
+            # with ssid as bytes; hidden networks (empty ssid) are dropped
+            # before decoding
+            result = [(net[0].decode("utf-8"), net[3], net[4]) for net in networks if net[0]]
             result.sort(key=lambda x: x[1], reverse=True)
             return result
         except Exception as e:
@@ -123,75 +237,82 @@ class WiFiManager:
         Returns:
             True if connected, False otherwise
         """
-        sta = self._get_sta()
+        sta = self._sta
         if not sta.active():
             sta.active(True)
-            import time
-
             time.sleep_ms(100)
 
         # Always mark as enabled when connecting
         self._sta_enabled = True
+        self._sta_paused = False
+        self._sta_snap = None
 
-        import time
-
-        # Disconnect if already connected
+        # Drop an existing association first, or the wait below could see
+        # the old network as connected. Only spin until the driver reports
+        # it gone (at most ~100 ms) instead of a fixed 300 ms sleep; the
+        # common not-connected path skips this entirely
         if sta.isconnected():
             sta.disconnect()
-            time.sleep_ms(300)
-
-        print(f"[wifi] Connecting to {ssid}...")
+            for _ in range(5):
+                if not sta.isconnected():
+                    break
+                time.sleep_ms(20)
+
+        if _DEBUG:
+            print(f"[wifi] Connecting to {ssid}...")
+        sta.config(reconnects=CONNECT_RECONNECTS)
         sta.connect(ssid, password)
 
-        # Wait for connection
-        iterations = timeout_ms // 100
-        for _ in range(iterations):
+        # Wait for connection. isconnected() only turns True once DHCP has
+        # given us an address, so no extra settle delay is needed; a
+        # definitive failure status ends the wait early
+        deadline = time.ticks_add(time.ticks_ms(), timeout_ms)
+        delay = CONNECT_POLL_MIN_MS
+        while time.ticks_diff(deadline, time.ticks_ms()) > 0:
             if sta.isconnected():
-                # Double-check connection is stable
-                time.sleep_ms(500)
-                if sta.isconnected():
+                # Back to unlimited retries, so a dropped link still recovers
+                sta.config(reconnects=-1)
+                if _DEBUG:
                     print(f"[wifi] Connected to {ssid}")
-                    self._sta_ssid = ssid
-                    self._sta_password = password
-                    return True
-            time.sleep_ms(100)
+                self._sta_ssid = ssid
+                self._sta_password = password
+                self._sta_snap = None
+                return True
+            status = sta.status()
+            if status == network.STAT_WRONG_PASSWORD or status == network.STAT_NO_AP_FOUND:
+                break
+            time.sleep_ms(delay)
+            delay = min(delay * 2, CONNECT_POLL_MAX_MS)
 
         # Connection failed - contextlib.suppress not available in MicroPython
         try:  # noqa: SIM105
             sta.disconnect()
         except Exception:
             pass
+        self._sta_snap = None
         print(f"[wifi] Connection to {ssid} failed")
         return False
 
     def sta_disconnect(self):
         """Disconnect from current network."""
-        sta = self._get_sta()
+        sta = self._sta
         if sta.isconnected():
             sta.disconnect()
-            print("[wifi] Disconnected")
+            if _DEBUG:
+                print("[wifi] Disconnected")
+        self._sta_snap = None
 
     def sta_is_connected(self):
         """Check if connected to a network."""
-        sta = self._get_sta()
-        return sta.active() and sta.isconnected()
+        return self._sta_status()[2]
 
     def sta_get_ip(self):
         """Get STA IP address or None if not connected."""
-        sta = self._get_sta()
-        if sta.isconnected():
-            return sta.ifconfig()[0]
-        return None
+        return self._sta_status()[3]
 
     def sta_get_ssid(self):
         """Get connected SSID or None."""
-        sta = self._get_sta()
-        if sta.isconnected():
-            try:
-                return sta.config("essid")
-            except Exception:
-                return self._sta_ssid
-        return None
+        return self._sta_status()[4]
 
     def get_sta_credentials(self):
         """Get saved STA credentials. Returns (ssid, password) or (None, None)."""
@@ -212,56 +333,63 @@ class WiFiManager:
         if ssid is not None:
             self._ap_ssid = ssid
         if password is not None:
-            self._ap_password = password
+            self._set_ap_password(password)
 
-        ap = self._get_ap()
+        ap = self._ap
         # UIFlow2: must be active, and set all config in one call
         ap.active(True)
         self._configure_ap(ap)
         self._ap_enabled = True
-        print("[wifi] AP enabled")
+        if _DEBUG:
+            print("[wifi] AP enabled")
 
     def ap_disable(self):
         """Disable AP interface."""
-        ap = self._get_ap()
-        ap.active(False)
+        self._ap.active(False)
         self._ap_enabled = False
-        print("[wifi] AP disabled")
+        if _DEBUG:
+            print("[wifi] AP disabled")
 
     def ap_is_enabled(self):
         """Check if AP interface is enabled."""
-        ap = self._get_ap()
-        return ap.active()
+        return self._ap.active()
 
     # -------------------------------------------------------------------------
     # AP operations
     # -------------------------------------------------------------------------
 
+    def _set_ap_password(self, password):
+        """Set the AP password and its authmode (validated once, here)."""
+        self._ap_password = password
+        self._ap_authmode = _ap_authmode(password)
+
     def _configure_ap(self, ap):
         """Configure AP (must be active, all params in one call for UIFlow2)."""
+        authmode = self._ap_authmode
         try:
-            # WPA2 requires minimum 8 character password
-            if self._ap_password and len(self._ap_password) >= 8:
-                print(f"[wifi] Configuring AP: {self._ap_ssid} (WPA2)")
+            if authmode is None:
+                # Invalid password (1-7 chars) - reject
+                print("[wifi] AP config rejected: password must be 8+ chars or empty")
+                return
+            if authmode == network.AUTH_OPEN:
+                if _DEBUG:
+                    print(f"[wifi] Configuring AP: {self._ap_ssid} (open)")
+                ap.config(essid=self._ap_ssid, authmode=authmode, max_clients=4)
+            else:
+                if _DEBUG:
+                    print(f"[wifi] Configuring AP: {self._ap_ssid} (WPA2)")
                 ap.config(
                     essid=self._ap_ssid,
-                    authmode=network.AUTH_WPA_WPA2_PSK,
+                    authmode=authmode,
                     password=self._ap_password,
+                    max_clients=4,
                 )
-            elif not self._ap_password:
-                print(f"[wifi] Configuring AP: {self._ap_ssid} (open)")
-                ap.config(essid=self._ap_ssid, authmode=network.AUTH_OPEN)
-            else:
-                # Invalid password (1-7 chars) - reject
-                print("[wifi] AP config rejected: password must be 8+ chars or empty")
-                return
-            ap.config(max_clients=4)
         except Exception as e:
             print(f"[wifi] AP config failed: {e}")
 
     def ap_get_ip(self):
         """Get AP IP address (usually 192.168.4.1)."""
-        ap = self._get_ap()
+        ap = self._ap
         if ap.active():
             return ap.ifconfig()[0]
         return DEFAULT_AP_IP
@@ -281,127 +409,147 @@ class WiFiManager:
         Returns:
             List of MAC address strings, or empty list
         """
-        ap = self._get_ap()
+        ap = self._ap
         if not ap.active():
             return []
 
-        # Try multiple methods as API varies by MicroPython variant
+        # Try multiple methods as API varies by MicroPython variant; the
+        # one that worked is remembered so later polls skip the failing call
         # Note: contextlib.suppress not available in MicroPython
         stations = None
-
-        # Method 1: status('stations') - works on some ESP32 builds
-        try:  # noqa: SIM105
-            stations = ap.status("stations")
-        except Exception:
-            pass
-
-        # Method 2: config('stations') - standard MicroPython
-        if stations is None:
-            try:  # noqa: SIM105
-                stations = ap.config("stations")
+        for key in self._ap_stations_keys:
+            try:
+                # status('stations') works on some ESP32 builds,
+                # config('stations') is standard MicroPython
+                stations = getattr(ap, key)("stations")
             except Exception:
-                pass
+                continue
+            # None means this build doesn't report stations here; keep
+            # falling back to the next method
+            if stations is not None:
+                self._ap_stations_keys = (key,)
+                break
 
         if not stations:
             return []
 
+        # The client set rarely changes between polls: reuse the formatted
+        # list while the driver reports the same stations
+        cached = self._ap_clients_cache
+        if cached is not None and cached[0] == stations:
+            return list(cached[1])
+
         result = []
         for station in stations:
             try:
                 # Station format varies - may be bytes (MAC) or tuple
-                if isinstance(station, bytes):
-                    mac_str = ":".join(f"{b:02x}" for b in station)
-                elif isinstance(station, tuple) and len(station) >= 1:
-                    mac = station[0]
-                    mac_str = ":".join(f"{b:02x}" for b in mac)
-                else:
+                if isinstance(station, tuple) and len(station) >= 1:
+                    station = station[0]
+                elif not isinstance(station, bytes):
                     continue
-                result.append(mac_str)
+                # One C call for the whole "aa:bb:..." string
+                result.append(binascii.hexlify(station, ":").decode())
             except Exception:
                 continue
-        return result
+        self._ap_clients_cache = (stations, result)
+        return list(result)
 
     def ap_set_config(self, ssid, password):
         """Update AP configuration and restart if active."""
         self._ap_ssid = ssid
-        self._ap_password = password
+        self._set_ap_password(password)
         if self.ap_is_enabled():
             # Reconfigure while active
-            ap = self._get_ap()
-            self._configure_ap(ap)
+            self._configure_ap(self._ap)
 
     # -------------------------------------------------------------------------
     # NVS persistence
     # -------------------------------------------------------------------------
 
+    def _config_values(self):
+        """Current configuration as {NVS key: int or str} to persist."""
+        # STA/AP enabled states are stored as integers (0/1)
+        values = {
+            NVS_KEY_STA_ENABLED: 1 if self._sta_enabled else 0,
+            NVS_KEY_AP_ENABLED: 1 if self._ap_enabled else 0,
+            NVS_KEY_AP_SSID: self._ap_ssid,
+            NVS_KEY_AP_PASSWORD: self._ap_password or "",
+        }
+        if self._sta_ssid:
+            values[NVS_KEY_STA_SSID] = self._sta_ssid
+            values[NVS_KEY_STA_PASSWORD] = self._sta_password or ""
+        return values
+
     def save_config(self):
-        """Save current configuration to NVS."""
+        """Save current configuration to NVS (only the keys that changed)."""
         try:
-            import esp32
-
-            nvs = esp32.NVS(NVS_NAMESPACE)
-
-            # Save STA/AP enabled states as integers (0/1)
-            nvs.set_i32(NVS_KEY_STA_ENABLED, 1 if self._sta_enabled else 0)
-            nvs.set_i32(NVS_KEY_AP_ENABLED, 1 if self._ap_enabled else 0)
-
-            if self._sta_ssid:
-                nvs.set_blob(NVS_KEY_STA_SSID, self._sta_ssid.encode("utf-8"))
-                nvs.set_blob(NVS_KEY_STA_PASSWORD, (self._sta_password or "").encode("utf-8"))
-
-            nvs.set_blob(NVS_KEY_AP_SSID, self._ap_ssid.encode("utf-8"))
-            nvs.set_blob(NVS_KEY_AP_PASSWORD, (self._ap_password or "").encode("utf-8"))
+            nvs = self._get_nvs()
+            saved = self._nvs_saved
+
+            # Each set is a flash write and the commit an erase/program
+            # cycle, so skip keys NVS already holds and skip an empty commit
+            changed = {}
+            for key, value in self._config_values().items():
+                if saved.get(key) == value:
+                    continue
+                if isinstance(value, int):
+                    nvs.set_i32(key, value)
+                else:
+                    nvs.set_blob(key, value.encode("utf-8"))
+                changed[key] = value
 
+            if not changed:
+                return
             nvs.commit()
-            print("[wifi] Config saved to NVS")
+            saved.update(changed)
+            if _DEBUG:
+                print("[wifi] Config saved to NVS")
         except Exception as e:
             print(f"[wifi] Save config failed: {e}")
 
     def load_config(self):
         """Load configuration from NVS."""
         try:
-            import esp32
-
-            nvs = esp32.NVS(NVS_NAMESPACE)
+            nvs = self._get_nvs()
+            # Record what each key that exists decodes to; missing keys stay
+            # out so the next save writes them
+            saved = self._nvs_saved = {}
 
             # Load STA/AP enabled states
             try:
                 self._sta_enabled = nvs.get_i32(NVS_KEY_STA_ENABLED) != 0
+                saved[NVS_KEY_STA_ENABLED] = 1 if self._sta_enabled else 0
             except OSError:
                 self._sta_enabled = False
 
             try:
                 self._ap_enabled = nvs.get_i32(NVS_KEY_AP_ENABLED) != 0
+                saved[NVS_KEY_AP_ENABLED] = 1 if self._ap_enabled else 0
             except OSError:
                 self._ap_enabled = False
 
             # Load STA credentials
             try:
-                buf = bytearray(64)
-                length = nvs.get_blob(NVS_KEY_STA_SSID, buf)
-                self._sta_ssid = buf[:length].decode("utf-8") if length else None
-
-                buf = bytearray(64)
-                length = nvs.get_blob(NVS_KEY_STA_PASSWORD, buf)
-                self._sta_password = buf[:length].decode("utf-8") if length else ""
+                self._sta_ssid = _read_blob_str(nvs, NVS_KEY_STA_SSID, None)
+                self._sta_password = _read_blob_str(nvs, NVS_KEY_STA_PASSWORD, "")
+                saved[NVS_KEY_STA_SSID] = self._sta_ssid
+                saved[NVS_KEY_STA_PASSWORD] = self._sta_password
             except OSError:
                 self._sta_ssid = None
                 self._sta_password = None
 
             # Load AP settings
             try:
-                buf = bytearray(64)
-                length = nvs.get_blob(NVS_KEY_AP_SSID, buf)
-                self._ap_ssid = buf[:length].decode("utf-8") if length else DEFAULT_AP_SSID
-
-                buf = bytearray(64)
-                length = nvs.get_blob(NVS_KEY_AP_PASSWORD, buf)
-                self._ap_password = buf[:length].decode("utf-8") if length else DEFAULT_AP_PASSWORD
+                self._ap_ssid = _read_blob_str(nvs, NVS_KEY_AP_SSID, DEFAULT_AP_SSID)
+                self._set_ap_password(_read_blob_str(nvs, NVS_KEY_AP_PASSWORD, DEFAULT_AP_PASSWORD))
+                saved[NVS_KEY_AP_SSID] = self._ap_ssid
+                saved[NVS_KEY_AP_PASSWORD] = self._ap_password
             except OSError:
                 self._ap_ssid = DEFAULT_AP_SSID
-                self._ap_password = DEFAULT_AP_PASSWORD
+                self._set_ap_password(DEFAULT_AP_PASSWORD)
 
-            print(f"[wifi] Config loaded: sta={self._sta_enabled}, ap={self._ap_enabled}")
+            if _DEBUG:
+                print(f"[wifi] Config loaded: sta={self._sta_enabled}, ap={self._ap_enabled}")
         except Exception as e:
             print(f"[wifi] Load config failed: {e}")
             self._sta_enabled = False
@@ -0,0 +1,28 @@
+"""Shared helpers for the firmware upload/flash scripts in tools/."""
+
+import subprocess
+from pathlib import Path
+
+
+def get_latest_firmware() -> Path | None:
+    """Find the most recently modified .bin file in firmware/."""
+    firmware_dir = Path("firmware")
+    if not firmware_dir.exists():
+        return None
+    return max(firmware_dir.glob("*.bin"), key=lambda p: p.stat().st_mtime, default=None)
+
+
+def curl_session(*requests: list[str]) -> subprocess.CompletedProcess:
+    """Run several requests in one curl process, sharing connection and cookies.
+
+    Requests are chained with --next, so curl reuses the TCP connection and
+    keeps session cookies in memory (-b "" turns the cookie engine on for
+    each request without a cookie file). --fail-early stops at the first
+    failed request.
+    """
+    cmd = ["curl", "--fail-early"]
+    for i, args in enumerate(requests):
+        if i:
+            cmd.append("--next")
+        cmd += ["-4", "-b", "", *args]
+    return subprocess.run(cmd, check=True)
@@ -2,18 +2,27 @@
 """Upload firmware to Cardputer via FTP (faster than M5Launcher web)."""
 
 import argparse
-import subprocess
+import ftplib
+import socket
 import sys
 from pathlib import Path
 
+from _firmware import get_latest_firmware
 
-def get_latest_firmware() -> Path | None:
-    """Find the most recently modified .bin file in firmware/."""
-    firmware_dir = Path("firmware")
-    if not firmware_dir.exists():
-        return None
-    bins = sorted(firmware_dir.glob("*.bin"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return bins[0] if bins else None
+# Send buffer for the data connection: the device acks slowly, so a deep
+# buffer keeps segments queued instead of waiting on each ack
+DATA_SNDBUF = 256 * 1024
+
+
+class UploadFTP(ftplib.FTP):
+    """FTP client whose data connections are tuned for bulk upload."""
+
+    def ntransfercmd(self, cmd, rest=None):
+        conn, size = super().ntransfercmd(cmd, rest)
+        # Don't hold back the short final segment of each block (Nagle)
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, DATA_SNDBUF)
+        return conn, size
 
 
 def main() -> int:
@@ -32,32 +41,32 @@ def main() -> int:
         print("Error: No firmware file found. Specify file or run 'poe firmware-download' first.")
         return 1
 
-    # Build FTP URL with optional auth
-    if args.user:
-        auth = f"{args.user}:{args.password}@" if args.password else f"{args.user}@"
-        remote_url = f"ftp://{auth}{args.host}{args.path}/{firmware.name}"
-    else:
-        remote_url = f"ftp://{args.host}{args.path}/{firmware.name}"
+    size = firmware.stat().st_size
+    sent = 0
+
+    def progress(block: bytes) -> None:
+        nonlocal sent
+        sent += len(block)
+        print(f"\r  {sent}/{size} bytes ({sent * 100 // max(size, 1)}%)", end="", flush=True)
 
     print(f"Uploading {firmware} to ftp://{args.host}{args.path}/ ...")
-    result = subprocess.run(
-        [
-            "curl",
-            "--ftp-port",
-            "-",
-            "-T",
-            str(firmware),
-            remote_url,
-            "--connect-timeout",
-            "30",
-        ],
-        check=False,
-    )
-
-    if result.returncode != 0:
-        print(f"Error: Upload failed with code {result.returncode}")
-        return result.returncode
+    try:
+        with UploadFTP(args.host, timeout=30) as ftp:
+            # Active mode, as with curl's --ftp-port - before
+            ftp.set_pasv(False)
+            if args.user:
+                ftp.login(args.user, args.password)
+            else:
+                ftp.login()
+            ftp.cwd(args.path)
+            # storbinary streams the file straight into the data socket
+            with firmware.open("rb") as f:
+                ftp.storbinary(f"STOR {firmware.name}", f, blocksize=8192, callback=progress)
+    except ftplib.all_errors as e:
+        print(f"\nError: Upload failed: {e}")
+        return 1
 
+    print()
     print("Done.")
     return 0
 
@@ -2,24 +2,10 @@
 """Flash firmware directly to device via M5Launcher OTA."""
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
 
-
-def get_latest_firmware() -> Path | None:
-    """Find the most recently modified .bin file in firmware/."""
-    firmware_dir = Path("firmware")
-    if not firmware_dir.exists():
-        return None
-    bins = sorted(firmware_dir.glob("*.bin"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return bins[0] if bins else None
-
-
-def curl(*args: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run curl with common options."""
-    cmd = ["curl", "-4", *args]
-    return subprocess.run(cmd, check=check)
+from _firmware import curl_session, get_latest_firmware
 
 
 def main() -> int:
@@ -38,55 +24,44 @@ def main() -> int:
         return 1
 
     size = firmware.stat().st_size
-    cookie_file = "/tmp/m5launcher_cookies.txt"
 
-    # Login
+    # Login, initiate OTA, then upload - one curl run for all three
     print(f"Logging into M5Launcher at {args.url} ...")
-    curl(
-        "-c",
-        cookie_file,
-        f"{args.url}/login",
-        "-X",
-        "POST",
-        "-H",
-        "Content-Type: application/x-www-form-urlencoded",
-        "-d",
-        f"username={args.user}&password={args.password}",
-        "--connect-timeout",
-        "10",
-        "-s",
-        "-o",
-        "/dev/null",
-    )
-
-    # Initiate OTA
-    print(f"Flashing {firmware} ({size} bytes) via OTA...")
-    print("Step 1: Initiating OTA...")
-    curl(
-        "-b",
-        cookie_file,
-        "-F",
-        "command=0",
-        "-F",
-        f"size={size}",
-        f"{args.url}/OTA",
-        "--connect-timeout",
-        "10",
-        "-s",
-    )
-
-    # Upload firmware
-    print("Step 2: Uploading firmware...")
-    curl(
-        "-b",
-        cookie_file,
-        "-F",
-        f"file1=@{firmware}",
-        f"{args.url}/OTAFILE",
-        "--connect-timeout",
-        "120",
-        "-w",
-        "HTTP %{http_code}\n",
+    print(f"Flashing {firmware} ({size} bytes) via OTA (initiate, then upload)...")
+    curl_session(
+        [
+            f"{args.url}/login",
+            "-X",
+            "POST",
+            "-H",
+            "Content-Type: application/x-www-form-urlencoded",
+            "-d",
+            f"username={args.user}&password={args.password}",
+            "--connect-timeout",
+            "10",
+            "-s",
+            "-o",
+            "/dev/null",
+        ],
+        [
+            "-F",
+            "command=0",
+            "-F",
+            f"size={size}",
+            f"{args.url}/OTA",
+            "--connect-timeout",
+            "10",
+            "-s",
+        ],
+        [
+            "-F",
+            f"file1=@{firmware}",
+            f"{args.url}/OTAFILE",
+            "--connect-timeout",
+            "120",
+            "-w",
+            "HTTP %{http_code}\n",
+        ],
     )
 
     print("Done. Device should reboot automatically.")
@@ -2,24 +2,10 @@
 """Upload firmware to M5Launcher SD card (/firmwares folder)."""
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
 
-
-def get_latest_firmware() -> Path | None:
-    """Find the most recently modified .bin file in firmware/."""
-    firmware_dir = Path("firmware")
-    if not firmware_dir.exists():
-        return None
-    bins = sorted(firmware_dir.glob("*.bin"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return bins[0] if bins else None
-
-
-def curl(*args: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run curl with common options."""
-    cmd = ["curl", "-4", *args]
-    return subprocess.run(cmd, check=check)
+from _firmware import curl_session, get_latest_firmware
 
 
 def main() -> int:
@@ -37,55 +23,43 @@ def main() -> int:
         print("Error: No firmware file found. Specify file or run 'poe firmware-download' first.")
         return 1
 
-    cookie_file = "/tmp/m5launcher_cookies.txt"
-
-    # Login
+    # Login, create the folder, then upload - one curl run for all three
     print(f"Logging into M5Launcher at {args.url} ...")
-    curl(
-        "-c",
-        cookie_file,
-        f"{args.url}/login",
-        "-X",
-        "POST",
-        "-H",
-        "Content-Type: application/x-www-form-urlencoded",
-        "-d",
-        f"username={args.user}&password={args.password}",
-        "--connect-timeout",
-        "10",
-        "-s",
-        "-o",
-        "/dev/null",
-    )
-
-    # Create folder
-    print("Creating /firmwares folder (if needed)...")
-    curl(
-        "-b",
-        cookie_file,
-        f"{args.url}/file?name=/firmwares&action=create",
-        "--connect-timeout",
-        "5",
-        "-s",
-        "-o",
-        "/dev/null",
-        check=False,
-    )
-
-    # Upload
-    print(f"Uploading {firmware} to /firmwares ...")
-    curl(
-        "-b",
-        cookie_file,
-        "-F",
-        f"file=@{firmware}",
-        "-F",
-        "folder=/firmwares",
-        f"{args.url}/",
-        "--connect-timeout",
-        "120",
-        "-w",
-        "HTTP %{http_code}\n",
+    print(f"Uploading {firmware} to /firmwares (creating the folder if needed)...")
+    curl_session(
+        [
+            f"{args.url}/login",
+            "-X",
+            "POST",
+            "-H",
+            "Content-Type: application/x-www-form-urlencoded",
+            "-d",
+            f"username={args.user}&password={args.password}",
+            "--connect-timeout",
+            "10",
+            "-s",
+            "-o",
+            "/dev/null",
+        ],
+        [
+            f"{args.url}/file?name=/firmwares&action=create",
+            "--connect-timeout",
+            "5",
+            "-s",
+            "-o",
+            "/dev/null",
+        ],
+        [
+            "-F",
+            f"file=@{firmware}",
+            "-F",
+            "folder=/firmwares",
+            f"{args.url}/",
+            "--connect-timeout",
+            "120",
+            "-w",
+            "HTTP %{http_code}\n",
+        ],
     )
 
     print("Done.")